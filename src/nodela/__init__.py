@@ -1,29 +1,36 @@
 """Nodela Python SDK."""
 
-from .client import NodelaClient
-from .exceptions import (
-    AuthenticationError,
-    NetworkError,
-    NodelaError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-)
-from .models.invoice import (
-    SUPPORTED_CURRENCIES,
-    CreateInvoiceParams,
-    CreateInvoiceResponse,
-    VerifyInvoiceResponse,
-)
-from .models.transaction import (
-    ListTransactionsResponse,
-    Transaction,
-)
+# Imported under private names so they do not show up in dir(nodela).
+import importlib as _importlib
+import typing as _typing
+
+if _typing.TYPE_CHECKING:  # pragma: no cover - only read by type checkers
+    from .async_client import AsyncNodelaClient
+    from .client import NodelaClient
+    from .exceptions import (
+        AuthenticationError,
+        NetworkError,
+        NodelaError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+        ValidationError,
+    )
+    from .models.invoice import (
+        SUPPORTED_CURRENCIES,
+        CreateInvoiceParams,
+        CreateInvoiceResponse,
+        VerifyInvoiceResponse,
+    )
+    from .models.transaction import (
+        ListTransactionsResponse,
+        Transaction,
+    )
 
 __version__ = "1.0.0"
 __all__ = [
     "NodelaClient",
+    "AsyncNodelaClient",
     "NodelaError",
     "AuthenticationError",
     "ValidationError",
@@ -38,3 +45,39 @@ __all__ = [
     "Transaction",
     "ListTransactionsResponse",
 ]
+
+# Submodule defining each export. They are imported on first access, so a bare
+# ``import nodela`` does not load requests, pydantic or the resource classes.
+_LAZY_EXPORTS: _typing.Dict[str, str] = {
+    "NodelaClient": ".client",
+    "AsyncNodelaClient": ".async_client",
+    "NodelaError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "NotFoundError": ".exceptions",
+    "ServerError": ".exceptions",
+    "NetworkError": ".exceptions",
+    "SUPPORTED_CURRENCIES": ".models.invoice",
+    "CreateInvoiceParams": ".models.invoice",
+    "CreateInvoiceResponse": ".models.invoice",
+    "VerifyInvoiceResponse": ".models.invoice",
+    "Transaction": ".models.transaction",
+    "ListTransactionsResponse": ".models.transaction",
+}
+
+
+def __getattr__(name: str) -> _typing.Any:
+    """Import a public export from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _typing.List[str]:
+    """List module attributes, including exports not yet imported."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,63 @@
+"""Async SDK client."""
+
+from typing import Optional
+
+from .client import NodelaClient
+from .resources.invoices import AsyncInvoices
+from .resources.transactions import AsyncTransactions
+
+
+class AsyncNodelaClient:
+    """
+    Async client for interacting with Nodela.
+
+    Each call runs the blocking request in a worker thread, so independent
+    calls awaited together with ``asyncio.gather`` are in flight at the same
+    time and share the client's keep-alive connection pool.
+
+    Args:
+      api_key: Your API key. If not provided, will look for NODELA_API_KEY env var
+      timeout: Request timeout in seconds. Defaults to 30.
+      max_retries: Maximum number of retries for failed requests. Defaults to 3
+      pool_maxsize: Maximum number of keep-alive connections kept open to the
+        API. Set it to the number of concurrent calls you expect. Defaults to 10.
+      warmup: Open a connection to the API in a background thread so the first
+        request does not pay for the TCP and TLS handshakes. Defaults to False.
+
+    Example
+    ```python
+      import asyncio
+
+      from nodela import AsyncNodelaClient
+
+      client = AsyncNodelaClient(api_key="your_api_key")
+
+      async def main():
+          verification, transactions = await asyncio.gather(
+              client.invoices.verify("inv_abc123"),
+              client.transactions.list(page=1),
+          )
+    ```
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        timeout: int = 30,
+        max_retries: int = 3,
+        pool_maxsize: int = 10,
+        warmup: bool = False,
+    ) -> None:
+        client = NodelaClient(
+            api_key=api_key,
+            timeout=timeout,
+            max_retries=max_retries,
+            pool_maxsize=pool_maxsize,
+            warmup=warmup,
+        )
+        self.api_key = client.api_key
+        self._http = client._http
+
+        # Resources
+        self.invoices = AsyncInvoices(client.invoices)
+        self.transactions = AsyncTransactions(client.transactions)
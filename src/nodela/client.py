@@ -1,6 +1,7 @@
 """Main SDK client."""
 
 import os
+import threading
 from typing import Optional
 
 from .exceptions import AuthenticationError
@@ -8,6 +9,9 @@ from .resources.invoices import Invoices
 from .resources.transactions import Transactions
 from .utils.http import HTTPClient
 
+# Bound once at import. Tests replace this instead of patching os.environ.
+_ENV_GETTER = os.environ.get
+
 
 class NodelaClient:
     """
@@ -17,6 +21,10 @@ class NodelaClient:
       api_key: Your API key. If not provided, will look for NODELA_API_KEY env var
       timeout: Reuqest timeout in seconds. Defaults to 30.
       max_retries: Maximum number of retires for failed requests. Defaults to 3
+      pool_maxsize: Maximum number of keep-alive connections kept open to the
+        API. Raise it when many threads share one client. Defaults to 10.
+      warmup: Open a connection to the API in a background thread so the first
+        request does not pay for the TCP and TLS handshakes. Defaults to False.
 
     Example
     ```python
@@ -31,8 +39,10 @@ class NodelaClient:
         api_key: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
+        pool_maxsize: int = 10,
+        warmup: bool = False,
     ) -> None:
-        self.api_key = api_key or os.getenv("NODELA_API_KEY")
+        self.api_key = api_key or _ENV_GETTER("NODELA_API_KEY")
         if not self.api_key:
             raise AuthenticationError(
                 "API key is required. Pass it as api_key parameter or "
@@ -44,7 +54,10 @@ class NodelaClient:
             api_key=self.api_key,
             timeout=timeout,
             max_retries=max_retries,
+            pool_maxsize=pool_maxsize,
         )
+        if warmup:
+            threading.Thread(target=self._http.warm_up, daemon=True).start()
 
         # Resources
         self.invoices = Invoices(self._http)
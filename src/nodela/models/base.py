@@ -14,9 +14,8 @@ class BaseModel(PydanticBaseModel):
     """Base model for all API response models"""
 
     model_config = ConfigDict(
-        extra="allow",
+        extra="ignore",
         use_enum_values=True,
-        validate_assignment=True,
         populate_by_name=True,
     )
 
@@ -27,4 +26,11 @@ class BaseModel(PydanticBaseModel):
     @classmethod
     def from_dict(cls: type[T], data: Dict[str, Any]) -> T:
         """Create model instance from dictionary."""
-        return cls(**data)
+        return cls.model_validate(data)
+
+
+class RequestBaseModel(BaseModel):
+    """Base model for request parameters built and mutated by callers"""
+
+    # Unlike responses, extra fields a caller sets are kept and sent to the API.
+    model_config = ConfigDict(extra="allow", validate_assignment=True)
@@ -1,80 +1,9 @@
 """Models for the Invoice resource."""
 
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, get_args
 
-from .base import BaseModel
-
-SUPPORTED_CURRENCIES = [
-    # Americas
-    "USD",
-    "CAD",
-    "MXN",
-    "BRL",
-    "ARS",
-    "CLP",
-    "COP",
-    "PEN",
-    "JMD",
-    "TTD",
-    # Europe
-    "EUR",
-    "GBP",
-    "CHF",
-    "SEK",
-    "NOK",
-    "DKK",
-    "PLN",
-    "CZK",
-    "HUF",
-    "RON",
-    "BGN",
-    "HRK",
-    "ISK",
-    "TRY",
-    "RUB",
-    "UAH",
-    # Africa
-    "NGN",
-    "ZAR",
-    "KES",
-    "GHS",
-    "EGP",
-    "MAD",
-    "TZS",
-    "UGX",
-    "XOF",
-    "XAF",
-    "ETB",
-    # Asia
-    "JPY",
-    "CNY",
-    "INR",
-    "KRW",
-    "IDR",
-    "MYR",
-    "THB",
-    "PHP",
-    "VND",
-    "SGD",
-    "HKD",
-    "TWD",
-    "BDT",
-    "PKR",
-    "LKR",
-    # Middle East
-    "AED",
-    "SAR",
-    "QAR",
-    "KWD",
-    "BHD",
-    "OMR",
-    "ILS",
-    "JOD",
-    # Oceania
-    "AUD",
-    "NZD",
-    "FJD",
-]
+from .base import BaseModel, RequestBaseModel
+from .payment import PaymentInfo
 
 SupportedCurrency = Literal[
     # Americas
@@ -148,16 +77,21 @@ SupportedCurrency = Literal[
     "FJD",
 ]
 
+# Derived from the Literal so the runtime list and the type can never drift.
+SUPPORTED_CURRENCIES: List[str] = list(get_args(SupportedCurrency))
+
+SUPPORTED_CURRENCIES_SET = frozenset(SUPPORTED_CURRENCIES)
+
 
 # --- Request models ---
 
 
-class CustomerParams(BaseModel):
+class CustomerParams(RequestBaseModel):
     email: str
     name: Optional[str] = None
 
 
-class CreateInvoiceParams(BaseModel):
+class CreateInvoiceParams(RequestBaseModel):
     amount: float
     currency: SupportedCurrency
     success_url: Optional[str] = None
@@ -203,19 +137,6 @@ class CreateInvoiceResponse(BaseModel):
     data: Optional[CreateInvoiceData] = None
 
 
-class PaymentInfo(BaseModel):
-    id: str
-    network: str
-    token: str
-    address: str
-    amount: float
-    status: str
-    tx_hash: List[str]
-    transaction_type: str
-    payer_email: str
-    created_at: str
-
-
 class VerifyInvoiceData(BaseModel):
     id: str
     invoice_id: str
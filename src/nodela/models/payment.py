@@ -0,0 +1,18 @@
+"""Payment model shared by the Invoice and Transaction resources."""
+
+from typing import List
+
+from .base import BaseModel
+
+
+class PaymentInfo(BaseModel):
+    id: str
+    network: str
+    token: str
+    address: str
+    amount: float
+    status: str
+    tx_hash: List[str]
+    transaction_type: str
+    payer_email: str
+    created_at: str
@@ -1,8 +1,10 @@
 """Models for the Transaction resource."""
 
-from typing import List
+from array import array
+from typing import Any, Dict, List, Union
 
 from .base import BaseModel
+from .payment import PaymentInfo
 
 
 class TransactionCustomer(BaseModel):
@@ -10,17 +12,9 @@ class TransactionCustomer(BaseModel):
     name: str
 
 
-class TransactionPayment(BaseModel):
-    id: str
-    network: str
-    token: str
-    address: str
-    amount: float
-    status: str
-    tx_hash: List[str]
-    transaction_type: str
-    payer_email: str
-    created_at: str
+# Transaction payments have the same shape as invoice payments; sharing the
+# class means pydantic builds a single validator for both.
+TransactionPayment = PaymentInfo
 
 
 class Transaction(BaseModel):
@@ -53,7 +47,61 @@ class ListTransactionsData(BaseModel):
     transactions: List[Transaction]
     pagination: Pagination
 
+    def to_columns(self) -> Dict[str, Union["array[float]", List[str]]]:
+        """
+        Project the page into one column per field for numeric work.
+
+        The amount fields become ``array('d')`` buffers of float64, which NumPy
+        can wrap without copying via ``numpy.frombuffer``. The identifier and
+        currency fields become plain lists. Every column has one entry per
+        transaction, in page order.
+
+        Returns:
+            Mapping of field name to its column.
+        """
+        transactions = self.transactions
+        return {
+            "id": [t.id for t in transactions],
+            "currency": [t.currency for t in transactions],
+            "original_currency": [t.original_currency for t in transactions],
+            "amount": array("d", [t.amount for t in transactions]),
+            "original_amount": array("d", [t.original_amount for t in transactions]),
+            "exchange_rate": array("d", [t.exchange_rate for t in transactions]),
+        }
+
 
 class ListTransactionsResponse(BaseModel):
     success: bool
     data: ListTransactionsData
+
+    @classmethod
+    def from_dict_unchecked(cls, data: Dict[str, Any]) -> "ListTransactionsResponse":
+        """
+        Create a response from trusted data without validating it.
+
+        Every nested model is built with ``model_construct``, so no type checks or
+        coercion run. Only use this for data already known to match the schema,
+        such as the output of ``to_dict``; use ``from_dict`` for anything else.
+
+        Args:
+            data: A list-transactions response body.
+
+        Returns:
+            ListTransactionsResponse built from ``data`` as-is.
+        """
+        page = data["data"]
+        return cls.model_construct(
+            success=data["success"],
+            data=ListTransactionsData.model_construct(
+                transactions=[_construct_transaction(item) for item in page["transactions"]],
+                pagination=Pagination.model_construct(**page["pagination"]),
+            ),
+        )
+
+
+def _construct_transaction(data: Dict[str, Any]) -> Transaction:
+    """Build a Transaction and its nested customer and payment without validation."""
+    fields = dict(data)
+    fields["customer"] = TransactionCustomer.model_construct(**data["customer"])
+    fields["payment"] = TransactionPayment.model_construct(**data["payment"])
+    return Transaction.model_construct(**fields)
@@ -11,7 +11,3 @@ class BaseResource:
 
     def __init__(self, http_client: "HTTPClient") -> None:
         self._http = http_client
-
-    def _build_endpoint(self, *parts: str) -> str:
-        """Build endpoint URL from parts."""
-        return "/".join(str(part) for part in parts)
@@ -1,13 +1,18 @@
 """Invoice resource for creating and verifying invoices."""
 
+import asyncio
+
 from ..models.invoice import (
     SUPPORTED_CURRENCIES,
+    SUPPORTED_CURRENCIES_SET,
     CreateInvoiceParams,
     CreateInvoiceResponse,
     VerifyInvoiceResponse,
 )
 from .base import BaseResource
 
+_SUPPORTED_LIST_STR = ", ".join(SUPPORTED_CURRENCIES)
+
 
 class Invoices(BaseResource):
     """Resource for managing invoices."""
@@ -28,17 +33,19 @@ class Invoices(BaseResource):
             ValueError: If the currency is not supported.
         """
         upper = params.currency.upper()
-        if upper not in SUPPORTED_CURRENCIES:
+        if upper not in SUPPORTED_CURRENCIES_SET:
             raise ValueError(
                 f'Unsupported currency: "{params.currency}". '
-                f"Supported currencies: {', '.join(SUPPORTED_CURRENCIES)}"
+                f"Supported currencies: {_SUPPORTED_LIST_STR}"
             )
 
-        payload = params.to_dict()
-        payload["currency"] = upper
+        # Serialize straight to JSON bytes in pydantic-core instead of dumping
+        # to a dict that requests would then encode again.
+        payload = params.model_copy(update={"currency": upper}).model_dump_json(exclude_none=True)
 
-        data = self._http.post(self.RESOURCE_PATH, data=payload)
-        return CreateInvoiceResponse.from_dict(data)
+        return self._http.request_model(
+            "POST", self.RESOURCE_PATH, CreateInvoiceResponse, content=payload.encode()
+        )
 
     def verify(self, invoice_id: str) -> VerifyInvoiceResponse:
         """
@@ -50,6 +57,36 @@ class Invoices(BaseResource):
         Returns:
             VerifyInvoiceResponse with invoice and payment details.
         """
-        endpoint = self._build_endpoint(self.RESOURCE_PATH, invoice_id, "verify")
-        data = self._http.get(endpoint)
-        return VerifyInvoiceResponse.from_dict(data)
+        endpoint = f"{self.RESOURCE_PATH}/{invoice_id}/verify"
+        return self._http.request_model("GET", endpoint, VerifyInvoiceResponse)
+
+
+class AsyncInvoices:
+    """Async resource for managing invoices."""
+
+    def __init__(self, invoices: Invoices) -> None:
+        self._sync = invoices
+
+    async def create(self, params: CreateInvoiceParams) -> CreateInvoiceResponse:
+        """
+        Create a new invoice without blocking the event loop.
+
+        Args:
+            params: Invoice creation parameters.
+
+        Returns:
+            CreateInvoiceResponse with invoice data and checkout URL.
+        """
+        return await asyncio.to_thread(self._sync.create, params)
+
+    async def verify(self, invoice_id: str) -> VerifyInvoiceResponse:
+        """
+        Verify an invoice's payment status without blocking the event loop.
+
+        Args:
+            invoice_id: The ID of the invoice to verify.
+
+        Returns:
+            VerifyInvoiceResponse with invoice and payment details.
+        """
+        return await asyncio.to_thread(self._sync.verify, invoice_id)
@@ -1,8 +1,9 @@
 """Transaction resource for listing transactions."""
 
-from typing import Optional
+import asyncio
+from typing import Dict, Iterator, Optional
 
-from ..models.transaction import ListTransactionsResponse
+from ..models.transaction import ListTransactionsResponse, Transaction
 from .base import BaseResource
 
 
@@ -26,11 +27,66 @@ class Transactions(BaseResource):
         Returns:
             ListTransactionsResponse with transactions and pagination info.
         """
-        params = {}
+        return self._http.request_model(
+            "GET", self.RESOURCE_PATH, ListTransactionsResponse, params=self._params(page, limit)
+        )
+
+    def iter(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Transaction]:
+        """
+        Iterate over one page of transactions, validating each lazily.
+
+        The page is fetched when ``iter`` is called, so request errors are raised
+        here rather than on the first ``next()``. Each transaction is validated
+        only when it is reached, so a caller that stops early skips the cost of
+        validating the rest of the page. Use ``list`` when the pagination info
+        is needed.
+
+        Args:
+            page: Page number for pagination.
+            limit: Number of results per page.
+
+        Returns:
+            An iterator of Transaction models in the order returned by the API.
+        """
+        body = self._http.get(self.RESOURCE_PATH, params=self._params(page, limit))
+        return (Transaction.model_validate(item) for item in body["data"]["transactions"])
+
+    @staticmethod
+    def _params(page: Optional[int], limit: Optional[int]) -> Optional[Dict[str, int]]:
+        """Build query parameters, or None when neither is set."""
+        if page is None and limit is None:
+            return None
+        params: Dict[str, int] = {}
         if page is not None:
             params["page"] = page
         if limit is not None:
             params["limit"] = limit
+        return params
+
 
-        data = self._http.get(self.RESOURCE_PATH, params=params or None)
-        return ListTransactionsResponse.from_dict(data)
+class AsyncTransactions:
+    """Async resource for managing transactions."""
+
+    def __init__(self, transactions: Transactions) -> None:
+        self._sync = transactions
+
+    async def list(
+        self,
+        page: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> ListTransactionsResponse:
+        """
+        List transactions without blocking the event loop.
+
+        Args:
+            page: Page number for pagination.
+            limit: Number of results per page.
+
+        Returns:
+            ListTransactionsResponse with transactions and pagination info.
+        """
+        return await asyncio.to_thread(self._sync.list, page=page, limit=limit)
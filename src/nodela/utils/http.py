@@ -1,6 +1,8 @@
 """HTTP utilities for API requests."""
 
-from typing import Any, Dict, Optional
+import functools
+import json
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -15,6 +17,45 @@ from ..exceptions import (
     ServerError,
     ValidationError,
 )
+from ..models.base import BaseModel
+
+# orjson is an optional speed-up for parsing dict bodies (``pip install nodela[fast]``).
+# Its decode errors subclass ValueError, like the stdlib's.
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+M = TypeVar("M", bound=BaseModel)
+
+_SUCCESS_STATUS_CODES = frozenset({200, 201})
+
+_STATUS_EXCEPTIONS: Dict[int, Type[NodelaError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    404: NotFoundError,
+    422: ValidationError,
+    429: RateLimitError,
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _build_retry(max_retries: int) -> Retry:
+    """
+    Build the retry strategy for a given retry budget.
+
+    urllib3 never mutates a Retry in place (``increment`` returns a new
+    instance), so one object can be shared by every client with the same
+    ``max_retries``.
+    """
+    return Retry(
+        total=max_retries,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    )
 
 
 class HTTPClient:
@@ -26,105 +67,97 @@ class HTTPClient:
         api_key: str,
         timeout: int = 30,
         max_retries: int = 3,
+        pool_maxsize: int = 10,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.api_key = api_key
         self.timeout = timeout
 
-        # Configure session with retry logic
+        self._base_headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+            "User-Agent": "NodelaSDK/1.0",
+        }
+
+        # Configure session with default headers and retry logic. The session
+        # merges its headers into every request, so they are built only once.
         self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+        self.session.headers.update(self._base_headers)
+        # The session keeps connections alive between calls, so only the first
+        # request to the API pays for the TCP and TLS handshakes. Every request
+        # goes to a single host, so one pool sized for concurrent callers is
+        # all that is needed.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=_build_retry(max_retries),
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
-    def _get_headers(self, custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Build request headers."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "User-Agent": "NodelaSDK/1.0",
-        }
-        if custom_headers:
-            headers.update(custom_headers)
-        return headers
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection to the API ahead of the first real request.
+
+        Sends a HEAD request to the base URL so the TCP and TLS handshakes are
+        done and the connection is left in the keep-alive pool. Any failure is
+        ignored; the next request will simply connect as usual.
+        """
+        try:
+            self.session.head(self._url_prefix, timeout=self.timeout).close()
+        except requests.exceptions.RequestException:
+            pass
 
     def _handle_response(self, response: requests.Response) -> Any:
         """Handle API response and raise appropriate exceptions."""
         try:
-            data = response.json()
+            # Parse the raw bytes directly; response.json() would first guess
+            # the encoding and decode the body to text.
+            data = _json_loads(response.content)
         except ValueError:
             data = {"message": response.text}
 
-        if response.status_code == 200 or response.status_code == 201:
+        status_code = response.status_code
+        if status_code in _SUCCESS_STATUS_CODES:
             return data
 
-        error_message = data.get("message", "An error occurred")
-
-        if response.status_code == 401:
-            raise AuthenticationError(
-                error_message,
-                status_code=response.status_code,
-                response=data,
-            )
-        elif response.status_code == 400 or response.status_code == 422:
-            raise ValidationError(
-                error_message,
-                status_code=response.status_code,
-                response=data,
-            )
-        elif response.status_code == 404:
-            raise NotFoundError(
-                error_message,
-                status_code=response.status_code,
-                response=data,
-            )
-        elif response.status_code == 429:
-            raise RateLimitError(
-                error_message,
-                status_code=response.status_code,
-                response=data,
-            )
-        elif response.status_code >= 500:
-            raise ServerError(
-                error_message,
-                status_code=response.status_code,
-                response=data,
-            )
-        else:
-            raise NodelaError(
-                error_message,
-                status_code=response.status_code,
-                response=data,
-            )
+        exc_cls = _STATUS_EXCEPTIONS.get(status_code) or (
+            ServerError if status_code >= 500 else NodelaError
+        )
+        raise exc_cls(
+            data.get("message", "An error occurred"),
+            status_code=status_code,
+            response=data,
+        )
 
-    def request(
+    def _send(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Any:
-        """Make an HTTP request to the API."""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        request_headers = self._get_headers(headers)
+        content: Optional[bytes] = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP request and return the raw response.
+
+        ``data`` is serialized to JSON by requests. ``content`` is sent as an
+        already-serialized JSON body and takes its place when given.
+        """
+        url = self._url_prefix + endpoint.lstrip("/")
 
         try:
-            response = self.session.request(
+            return self.session.request(
                 method=method,
                 url=url,
                 json=data,
+                data=content,
                 params=params,
-                headers=request_headers,
+                headers=headers,
                 timeout=self.timeout,
             )
-            return self._handle_response(response)
         except requests.exceptions.Timeout as e:
             raise NetworkError(f"Request timed out: {str(e)}")
         except requests.exceptions.ConnectionError as e:
@@ -132,6 +165,42 @@ class HTTPClient:
         except requests.exceptions.RequestException as e:
             raise NodelaError(f"Request failed: {str(e)}")
 
+    def request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Make an HTTP request to the API."""
+        response = self._send(method, endpoint, data=data, params=params, headers=headers)
+        return self._handle_response(response)
+
+    def request_model(
+        self,
+        method: str,
+        endpoint: str,
+        model_cls: Type[M],
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content: Optional[bytes] = None,
+    ) -> M:
+        """
+        Make an HTTP request and validate the response body into a model.
+
+        Successful bodies are parsed and validated in a single pass with
+        ``model_validate_json``, skipping the intermediate dict. Error bodies
+        still go through ``_handle_response`` to raise the matching exception.
+        """
+        response = self._send(
+            method, endpoint, data=data, params=params, headers=headers, content=content
+        )
+        if response.status_code not in _SUCCESS_STATUS_CODES:
+            self._handle_response(response)
+        return model_cls.model_validate_json(response.content)
+
     def get(
         self,
         endpoint: str,
@@ -1,22 +1,25 @@
 """Pytest configuration and shared fixtures."""
 
-from typing import Any, Dict
+import inspect
+import json
+from typing import Any, Callable, Dict, FrozenSet
 from unittest.mock import Mock
 
 import pytest
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from nodela.client import NodelaClient
 from nodela.utils.http import HTTPClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key() -> str:
     """Return a test API key."""
     return "test_api_key_12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_url() -> str:
     """Return the test base URL."""
     return "https://api.nodela.co"
@@ -31,6 +34,39 @@ def mock_response() -> Mock:
     return response
 
 
+@pytest.fixture
+def json_response() -> Callable[..., Response]:
+    """Return a factory building real JSON responses."""
+
+    def _make(data: Dict[str, Any], status_code: int = 200) -> Response:
+        response = Response()
+        response.status_code = status_code
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(data).encode()
+        return response
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def _adapter_send_mock() -> Mock:
+    """Return one Mock reused as HTTPAdapter.send by every test in a module."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_send(_adapter_send_mock: Mock, monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """
+    Patch HTTPAdapter.send with the module's shared mock, freshly reset.
+
+    The real session still prepares each request, so the mock receives the final
+    PreparedRequest with its URL, headers and body.
+    """
+    _adapter_send_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(HTTPAdapter, "send", _adapter_send_mock)
+    return _adapter_send_mock
+
+
 @pytest.fixture
 def http_client(api_key: str, base_url: str) -> HTTPClient:
     """Create an HTTPClient instance for testing."""
@@ -42,12 +78,34 @@ def http_client(api_key: str, base_url: str) -> HTTPClient:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nodela_client(api_key: str) -> NodelaClient:
-    """Create a NodelaClient instance for testing."""
+    """
+    Create a NodelaClient instance shared by the whole test session.
+
+    Tests must not mutate it; construct a client directly when one needs
+    different settings.
+    """
     return NodelaClient(api_key=api_key, timeout=30, max_retries=3)
 
 
+@pytest.fixture(scope="session")
+def default_client(api_key: str) -> NodelaClient:
+    """
+    Create a NodelaClient with only the API key set, shared by the session.
+
+    Used by read-only tests that check default configuration. Tests must not
+    mutate it.
+    """
+    return NodelaClient(api_key=api_key)
+
+
+@pytest.fixture(scope="session")
+def client_init_params() -> FrozenSet[str]:
+    """Return the parameter names of NodelaClient.__init__, inspected once."""
+    return frozenset(inspect.signature(NodelaClient.__init__).parameters)
+
+
 @pytest.fixture
 def mock_invoice_response_data() -> Dict[str, Any]:
     """Return mock invoice creation response data."""
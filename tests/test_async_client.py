@@ -0,0 +1,154 @@
+"""Unit tests for AsyncNodelaClient."""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict
+from unittest.mock import patch
+
+import pytest
+from requests import Response
+
+from nodela.async_client import AsyncNodelaClient
+from nodela.exceptions import AuthenticationError, NotFoundError
+from nodela.models.invoice import (
+    CreateInvoiceParams,
+    CreateInvoiceResponse,
+    VerifyInvoiceResponse,
+)
+from nodela.models.transaction import ListTransactionsResponse
+from nodela.resources.invoices import AsyncInvoices
+from nodela.resources.transactions import AsyncTransactions
+from nodela.utils.http import HTTPClient
+
+
+class TestAsyncNodelaClientInitialization:
+    """Test cases for AsyncNodelaClient initialization."""
+
+    def test_initialization_with_api_key(self, api_key: str) -> None:
+        """Test async client initialization with API key parameter."""
+        client = AsyncNodelaClient(api_key=api_key)
+
+        assert client.api_key == api_key
+        assert isinstance(client._http, HTTPClient)
+        assert isinstance(client.invoices, AsyncInvoices)
+        assert isinstance(client.transactions, AsyncTransactions)
+
+    def test_initialization_passes_configuration(self, api_key: str) -> None:
+        """Test that configuration is passed through to the HTTP client."""
+        client = AsyncNodelaClient(api_key=api_key, timeout=45, pool_maxsize=32)
+
+        adapter = client._http.session.get_adapter("https://api.nodela.co")
+        assert client._http.timeout == 45
+        assert adapter._pool_maxsize == 32
+
+    def test_initialization_without_api_key_raises_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that missing API key raises AuthenticationError."""
+        monkeypatch.delenv("NODELA_API_KEY", raising=False)
+
+        with pytest.raises(AuthenticationError):
+            AsyncNodelaClient()
+
+
+class TestAsyncNodelaClientRequests:
+    """Test cases for AsyncNodelaClient resource calls."""
+
+    def test_create_invoice(
+        self,
+        api_key: str,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
+    ) -> None:
+        """Test creating an invoice through the async client."""
+        client = AsyncNodelaClient(api_key=api_key)
+        params = CreateInvoiceParams(amount=100.0, currency="USD")
+
+        with patch.object(
+            client._http, "_send", return_value=json_response(mock_invoice_response_data)
+        ) as mock_send:
+            response = asyncio.run(client.invoices.create(params))
+
+        assert isinstance(response, CreateInvoiceResponse)
+        assert response.data is not None
+        assert response.data.id == "inv_test123"
+        assert mock_send.call_args[0][:2] == ("POST", "v1/invoices")
+
+    def test_verify_invoice(
+        self,
+        api_key: str,
+        json_response: Callable[..., Response],
+        mock_verify_invoice_response_data: Dict[str, Any],
+    ) -> None:
+        """Test verifying an invoice through the async client."""
+        client = AsyncNodelaClient(api_key=api_key)
+
+        with patch.object(
+            client._http, "_send", return_value=json_response(mock_verify_invoice_response_data)
+        ):
+            response = asyncio.run(client.invoices.verify("inv_test123"))
+
+        assert isinstance(response, VerifyInvoiceResponse)
+        assert response.data is not None
+        assert response.data.paid is True
+
+    def test_list_transactions(
+        self,
+        api_key: str,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
+    ) -> None:
+        """Test listing transactions through the async client."""
+        client = AsyncNodelaClient(api_key=api_key)
+
+        with patch.object(
+            client._http,
+            "_send",
+            return_value=json_response(mock_list_transactions_response_data),
+        ) as mock_send:
+            response = asyncio.run(client.transactions.list(page=2, limit=5))
+
+        assert isinstance(response, ListTransactionsResponse)
+        assert response.data.transactions[0].id == "txn_test123"
+        assert mock_send.call_args[1]["params"] == {"page": 2, "limit": 5}
+
+    def test_errors_propagate(self, api_key: str, json_response: Callable[..., Response]) -> None:
+        """Test that SDK exceptions are raised from the awaited call."""
+        client = AsyncNodelaClient(api_key=api_key)
+        response = json_response({"message": "Invoice not found"}, status_code=404)
+
+        with patch.object(client._http, "_send", return_value=response):
+            with pytest.raises(NotFoundError):
+                asyncio.run(client.invoices.verify("inv_missing"))
+
+    def test_gathered_calls_run_concurrently(
+        self,
+        api_key: str,
+        json_response: Callable[..., Response],
+        mock_verify_invoice_response_data: Dict[str, Any],
+        mock_list_transactions_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that gathered calls are in flight at the same time."""
+        client = AsyncNodelaClient(api_key=api_key)
+        barrier = threading.Barrier(2, timeout=5)
+        responses = {
+            "v1/invoices/inv_test123/verify": mock_verify_invoice_response_data,
+            "v1/transactions": mock_list_transactions_response_data,
+        }
+
+        def send(method: str, endpoint: str, **kwargs: Any) -> Response:
+            # Both calls must reach the barrier before either can return.
+            barrier.wait()
+            return json_response(responses[endpoint])
+
+        async def run() -> Any:
+            return await asyncio.gather(
+                client.invoices.verify("inv_test123"),
+                client.transactions.list(),
+            )
+
+        with patch.object(client._http, "_send", side_effect=send):
+            verify_response, list_response = asyncio.run(run())
+
+        assert isinstance(verify_response, VerifyInvoiceResponse)
+        assert isinstance(list_response, ListTransactionsResponse)
@@ -1,10 +1,12 @@
 """Unit tests for NodelaClient."""
 
 import os
+from typing import Dict, FrozenSet, Optional
 from unittest.mock import patch
 
 import pytest
 
+import nodela.client
 from nodela.client import NodelaClient
 from nodela.exceptions import AuthenticationError
 from nodela.resources.invoices import Invoices
@@ -15,78 +17,92 @@ from nodela.utils.http import HTTPClient
 class TestNodelaClientInitialization:
     """Test cases for NodelaClient initialization."""
 
-    def test_initialization_with_api_key(self, api_key: str) -> None:
-        """Test client initialization with API key parameter."""
-        client = NodelaClient(api_key=api_key)
-
-        assert client.api_key == api_key
-        assert client._http is not None
-        assert isinstance(client._http, HTTPClient)
-        assert isinstance(client.invoices, Invoices)
-        assert isinstance(client.transactions, Transactions)
-
-    def test_initialization_with_env_var(self, api_key: str) -> None:
+    def test_initialization_with_env_var(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test client initialization with environment variable."""
-        with patch.dict(os.environ, {"NODELA_API_KEY": api_key}):
-            client = NodelaClient()
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {"NODELA_API_KEY": api_key}.get)
+
+        client = NodelaClient()
 
         assert client.api_key == api_key
 
-    def test_initialization_without_api_key_raises_error(self) -> None:
+    def test_initialization_without_api_key_raises_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that missing API key raises AuthenticationError."""
-        # Clear the environment variable if it exists
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AuthenticationError) as exc_info:
-                NodelaClient()
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {}.get)
 
-        assert "API key is required" in str(exc_info.value)
+        with pytest.raises(AuthenticationError, match="API key is required"):
+            NodelaClient()
 
-    def test_initialization_prefers_param_over_env(self, api_key: str) -> None:
+    def test_initialization_prefers_param_over_env(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that parameter API key takes precedence over environment variable."""
         env_key = "env_api_key"
         param_key = "param_api_key"
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {"NODELA_API_KEY": env_key}.get)
 
-        with patch.dict(os.environ, {"NODELA_API_KEY": env_key}):
-            client = NodelaClient(api_key=param_key)
+        client = NodelaClient(api_key=param_key)
 
         assert client.api_key == param_key
         assert client.api_key != env_key
 
-    def test_initialization_with_custom_timeout(self, api_key: str) -> None:
-        """Test client initialization with custom timeout."""
-        client = NodelaClient(api_key=api_key, timeout=60)
+    @pytest.mark.parametrize(
+        "timeout, max_retries",
+        [(None, None), (60, None), (None, 5), (45, 4), (60, 5)],
+    )
+    def test_initialization(
+        self, api_key: str, timeout: Optional[int], max_retries: Optional[int]
+    ) -> None:
+        """Test that constructor arguments and defaults reach the HTTP client."""
+        kwargs: Dict[str, int] = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        if max_retries is not None:
+            kwargs["max_retries"] = max_retries
+
+        client = NodelaClient(api_key=api_key, **kwargs)
 
-        assert client._http.timeout == 60
-
-    def test_initialization_with_custom_max_retries(self, api_key: str) -> None:
-        """Test client initialization with custom max retries."""
-        client = NodelaClient(api_key=api_key, max_retries=5)
+        assert client.api_key == api_key
+        assert isinstance(client._http, HTTPClient)
+        assert isinstance(client.invoices, Invoices)
+        assert isinstance(client.transactions, Transactions)
+        assert client._http.base_url == "https://api.nodela.co"
+        assert client._http.api_key == api_key
+        assert client._http.timeout == (30 if timeout is None else timeout)
+        retry = client._http.session.get_adapter("https://api.nodela.co").max_retries
+        assert retry.total == (3 if max_retries is None else max_retries)
 
-        # The HTTP client should be configured with max_retries
-        assert client._http is not None
+    def test_initialization_with_custom_pool_maxsize(self, api_key: str) -> None:
+        """Test that pool_maxsize is passed through to the HTTP adapter."""
+        client = NodelaClient(api_key=api_key, pool_maxsize=32)
 
-    def test_initialization_with_all_params(self, api_key: str) -> None:
-        """Test client initialization with all parameters."""
-        client = NodelaClient(api_key=api_key, timeout=45, max_retries=4)
+        adapter = client._http.session.get_adapter("https://api.nodela.co")
+        assert adapter._pool_maxsize == 32
 
-        assert client.api_key == api_key
-        assert client._http.timeout == 45
+    def test_warmup_starts_background_thread(self, api_key: str) -> None:
+        """Test that warmup=True warms the pool in a daemon thread."""
+        with patch("nodela.client.threading.Thread") as mock_thread:
+            client = NodelaClient(api_key=api_key, warmup=True)
 
-    def test_http_client_configured_correctly(self, api_key: str) -> None:
-        """Test that HTTP client is configured with correct parameters."""
-        timeout = 60
-        max_retries = 5
+        mock_thread.assert_called_once_with(target=client._http.warm_up, daemon=True)
+        mock_thread.return_value.start.assert_called_once()
 
-        client = NodelaClient(api_key=api_key, timeout=timeout, max_retries=max_retries)
+    def test_no_warmup_by_default(self, api_key: str) -> None:
+        """Test that no warm-up thread is started by default."""
+        with patch("nodela.client.threading.Thread") as mock_thread:
+            NodelaClient(api_key=api_key)
 
-        assert client._http.base_url == "https://api.nodela.co"
-        assert client._http.api_key == api_key
-        assert client._http.timeout == timeout
+        mock_thread.assert_not_called()
 
 
 class TestNodelaClientResources:
     """Test cases for client resource initialization."""
 
+    pytestmark = pytest.mark.fast
+
     def test_invoices_resource_initialized(self, nodela_client: NodelaClient) -> None:
         """Test that invoices resource is properly initialized."""
         assert hasattr(nodela_client, "invoices")
@@ -108,23 +124,26 @@ class TestNodelaClientResources:
 class TestNodelaClientAPIKey:
     """Test cases for API key handling."""
 
-    def test_api_key_stored(self, api_key: str) -> None:
+    @pytest.mark.fast
+    def test_api_key_stored(self, api_key: str, default_client: NodelaClient) -> None:
         """Test that API key is stored on the client."""
-        client = NodelaClient(api_key=api_key)
+        assert default_client.api_key == api_key
 
-        assert client.api_key == api_key
-
-    def test_empty_api_key_raises_error(self) -> None:
+    @pytest.mark.fast
+    def test_empty_api_key_raises_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that empty API key raises error."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AuthenticationError):
-                NodelaClient(api_key="")
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {}.get)
+
+        with pytest.raises(AuthenticationError):
+            NodelaClient(api_key="")
 
-    def test_none_api_key_with_no_env_raises_error(self) -> None:
+    @pytest.mark.fast
+    def test_none_api_key_with_no_env_raises_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that None API key with no env var raises error."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AuthenticationError):
-                NodelaClient(api_key=None)
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {}.get)
+
+        with pytest.raises(AuthenticationError):
+            NodelaClient(api_key=None)
 
     def test_whitespace_api_key_accepted(self) -> None:
         """Test that whitespace-only API key is accepted (will fail at API level)."""
@@ -143,19 +162,24 @@ class TestNodelaClientEnvironmentVariables:
 
         assert client.api_key == api_key
 
-    def test_env_var_name_is_case_sensitive(self, api_key: str) -> None:
+    def test_env_var_name_is_case_sensitive(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that environment variable name is case-sensitive."""
-        with patch.dict(os.environ, {"nodela_api_key": api_key}, clear=True):
-            with pytest.raises(AuthenticationError):
-                NodelaClient()
+        monkeypatch.delenv("NODELA_API_KEY", raising=False)
+        monkeypatch.setenv("nodela_api_key", api_key)
+
+        with pytest.raises(AuthenticationError):
+            NodelaClient()
 
-    def test_multiple_env_vars_only_correct_one_used(self, api_key: str) -> None:
+    def test_multiple_env_vars_only_correct_one_used(
+        self, api_key: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that only the correct env var is used."""
-        with patch.dict(
-            os.environ,
-            {"NODELA_API_KEY": api_key, "API_KEY": "wrong_key", "NODELA_KEY": "also_wrong"},
-        ):
-            client = NodelaClient()
+        env = {"NODELA_API_KEY": api_key, "API_KEY": "wrong_key", "NODELA_KEY": "also_wrong"}
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", env.get)
+
+        client = NodelaClient()
 
         assert client.api_key == api_key
 
@@ -163,24 +187,21 @@ class TestNodelaClientEnvironmentVariables:
 class TestNodelaClientDefaults:
     """Test cases for client default values."""
 
-    def test_default_timeout(self, api_key: str) -> None:
-        """Test default timeout value."""
-        client = NodelaClient(api_key=api_key)
+    pytestmark = pytest.mark.fast
 
-        assert client._http.timeout == 30
+    def test_default_timeout(self, default_client: NodelaClient) -> None:
+        """Test default timeout value."""
+        assert default_client._http.timeout == 30
 
-    def test_default_max_retries(self, api_key: str) -> None:
+    def test_default_max_retries(self, default_client: NodelaClient) -> None:
         """Test that default max retries is configured."""
-        client = NodelaClient(api_key=api_key)
+        retry = default_client._http.session.get_adapter("https://api.nodela.co").max_retries
 
-        # Should have session configured
-        assert client._http.session is not None
+        assert retry.total == 3
 
-    def test_default_base_url(self, api_key: str) -> None:
+    def test_default_base_url(self, default_client: NodelaClient) -> None:
         """Test default base URL."""
-        client = NodelaClient(api_key=api_key)
-
-        assert client._http.base_url == "https://api.nodela.co"
+        assert default_client._http.base_url == "https://api.nodela.co"
 
 
 class TestNodelaClientIntegration:
@@ -209,31 +230,36 @@ class TestNodelaClientIntegration:
         assert client1._http.timeout == 30
         assert client2._http.timeout == 60
 
+    def test_clients_with_same_settings_do_not_share_session(self, api_key: str) -> None:
+        """Test that identically configured clients get their own HTTP client."""
+        client1 = NodelaClient(api_key=api_key, timeout=15, max_retries=2)
+        client2 = NodelaClient(api_key=api_key, timeout=15, max_retries=2)
+
+        assert client1._http is not client2._http
+        assert client1._http.session is not client2._http.session
+
     def test_client_http_client_session_is_configured(self, nodela_client: NodelaClient) -> None:
         """Test that the HTTP client session is properly configured."""
         session = nodela_client._http.session
 
-        assert session is not None
-        assert "https://" in session.adapters
-        assert "http://" in session.adapters
+        adapter = session.get_adapter("https://api.nodela.co")
+        assert adapter is session.get_adapter("http://api.nodela.co")
+        assert adapter.max_retries.total == 3
 
 
 class TestNodelaClientDocumentation:
     """Test cases for client documentation and attributes."""
 
+    pytestmark = pytest.mark.fast
+
     def test_client_has_docstring(self) -> None:
         """Test that client class has documentation."""
         assert NodelaClient.__doc__ is not None
         assert len(NodelaClient.__doc__) > 0
 
-    def test_client_init_signature(self) -> None:
+    def test_client_init_signature(self, client_init_params: FrozenSet[str]) -> None:
         """Test that client __init__ has correct signature."""
-        import inspect
-
-        sig = inspect.signature(NodelaClient.__init__)
-        assert "api_key" in sig.parameters
-        assert "timeout" in sig.parameters
-        assert "max_retries" in sig.parameters
+        assert {"api_key", "timeout", "max_retries"} <= client_init_params
 
     def test_client_attributes_accessible(self, nodela_client: NodelaClient) -> None:
         """Test that all expected client attributes are accessible."""
@@ -246,27 +272,34 @@ class TestNodelaClientDocumentation:
 class TestNodelaClientErrorHandling:
     """Test cases for client error handling."""
 
-    def test_authentication_error_message_with_no_api_key(self) -> None:
+    pytestmark = pytest.mark.fast
+
+    def test_authentication_error_message_with_no_api_key(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that authentication error has helpful message."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AuthenticationError) as exc_info:
-                NodelaClient()
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {}.get)
 
-        error_message = str(exc_info.value)
-        assert "API key is required" in error_message
-        assert "NODELA_API_KEY" in error_message
+        with pytest.raises(AuthenticationError, match=r"API key is required.*NODELA_API_KEY"):
+            NodelaClient()
 
-    def test_authentication_error_when_param_is_none_and_no_env(self) -> None:
+    def test_authentication_error_when_param_is_none_and_no_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test authentication error when param is explicitly None."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AuthenticationError):
-                NodelaClient(api_key=None)
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {}.get)
+
+        with pytest.raises(AuthenticationError):
+            NodelaClient(api_key=None)
 
-    def test_authentication_error_when_param_is_empty_string(self) -> None:
+    def test_authentication_error_when_param_is_empty_string(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test authentication error when param is empty string."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(AuthenticationError):
-                NodelaClient(api_key="")
+        monkeypatch.setattr(nodela.client, "_ENV_GETTER", {}.get)
+
+        with pytest.raises(AuthenticationError):
+            NodelaClient(api_key="")
 
 
 class TestNodelaClientConfiguration:
@@ -284,19 +317,19 @@ class TestNodelaClientConfiguration:
 
         assert client._http.timeout == 300
 
-    def test_different_timeout_values(self, api_key: str) -> None:
+    @pytest.mark.parametrize(
+        "timeout", (1, 5, 10, 30, 60, 120), ids=("1", "5", "10", "30", "60", "120")
+    )
+    def test_different_timeout_values(self, api_key: str, timeout: int) -> None:
         """Test various timeout values."""
-        timeouts = [1, 5, 10, 30, 60, 120]
+        client = NodelaClient(api_key=api_key, timeout=timeout)
 
-        for timeout in timeouts:
-            client = NodelaClient(api_key=api_key, timeout=timeout)
-            assert client._http.timeout == timeout
+        assert client._http.timeout == timeout
 
-    def test_different_retry_values(self, api_key: str) -> None:
+    @pytest.mark.parametrize("max_retries", (0, 1, 3, 5, 10), ids=("0", "1", "3", "5", "10"))
+    def test_different_retry_values(self, api_key: str, max_retries: int) -> None:
         """Test various max_retries values."""
-        retries = [0, 1, 3, 5, 10]
+        client = NodelaClient(api_key=api_key, max_retries=max_retries)
 
-        for retry in retries:
-            client = NodelaClient(api_key=api_key, max_retries=retry)
-            # Client should be created successfully
-            assert client._http is not None
+        retry = client._http.session.get_adapter("https://api.nodela.co").max_retries
+        assert retry.total == max_retries
@@ -1,6 +1,7 @@
 """Unit tests for exception classes."""
 
-from typing import Any, Dict
+import pickle
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 import pytest
 
@@ -14,6 +15,40 @@ from nodela.exceptions import (
     ValidationError,
 )
 
+pytestmark = pytest.mark.fast
+
+EXC_CLASSES: List[Type[NodelaError]] = [
+    AuthenticationError,
+    ValidationError,
+    RateLimitError,
+    NotFoundError,
+    ServerError,
+    NetworkError,
+]
+
+AUTH_RESPONSE: Dict[str, Any] = {"error": "unauthorized"}
+VALIDATION_RESPONSE: Dict[str, Any] = {
+    "errors": [
+        {"field": "email", "message": "Invalid email format"},
+        {"field": "amount", "message": "Must be positive"},
+    ]
+}
+RATE_LIMIT_RESPONSE: Dict[str, Any] = {"retry_after": 60}
+NOT_FOUND_RESPONSE: Dict[str, Any] = {"resource": "invoice", "id": "inv_123"}
+SERVER_RESPONSE: Dict[str, Any] = {"error_id": "err_xyz789", "timestamp": "2024-01-01T00:00:00Z"}
+
+EXC_CASES: List[Tuple[Type[NodelaError], str, int, Optional[Dict[str, Any]]]] = [
+    (AuthenticationError, "Invalid API key", 401, AUTH_RESPONSE),
+    (ValidationError, "Bad request", 400, None),
+    (ValidationError, "Validation failed", 422, VALIDATION_RESPONSE),
+    (RateLimitError, "Rate limited", 429, RATE_LIMIT_RESPONSE),
+    (NotFoundError, "Invoice not found", 404, NOT_FOUND_RESPONSE),
+    (ServerError, "Internal error", 500, SERVER_RESPONSE),
+    (ServerError, "Bad gateway", 502, None),
+    (ServerError, "Service unavailable", 503, None),
+    (ServerError, "Gateway timeout", 504, None),
+]
+
 
 class TestNodelaError:
     """Test cases for the base NodelaError exception."""
@@ -54,142 +89,41 @@ class TestNodelaError:
         assert isinstance(error, Exception)
         assert isinstance(error, NodelaError)
 
+    def test_pickle_roundtrip_keeps_details(self) -> None:
+        """Test that status code and response survive pickling."""
+        error = NotFoundError("Not found", status_code=404, response={"message": "Not found"})
 
-class TestAuthenticationError:
-    """Test cases for AuthenticationError."""
-
-    def test_inheritance(self) -> None:
-        """Test that AuthenticationError inherits from NodelaError."""
-        error = AuthenticationError("Auth failed")
-        assert isinstance(error, NodelaError)
-        assert isinstance(error, AuthenticationError)
-
-    def test_with_status_code(self) -> None:
-        """Test AuthenticationError with status code 401."""
-        error = AuthenticationError("Invalid API key", status_code=401)
-        assert str(error) == "Invalid API key"
-        assert error.status_code == 401
-
-    def test_with_response_data(self) -> None:
-        """Test AuthenticationError with response data."""
-        response: Dict[str, str] = {"error": "unauthorized"}
-        error = AuthenticationError("Auth failed", status_code=401, response=response)
-        assert error.response == response
-
-
-class TestValidationError:
-    """Test cases for ValidationError."""
-
-    def test_inheritance(self) -> None:
-        """Test that ValidationError inherits from NodelaError."""
-        error = ValidationError("Validation failed")
-        assert isinstance(error, NodelaError)
-        assert isinstance(error, ValidationError)
-
-    def test_with_status_code(self) -> None:
-        """Test ValidationError with status codes 400 or 422."""
-        error_400 = ValidationError("Bad request", status_code=400)
-        assert error_400.status_code == 400
-
-        error_422 = ValidationError("Unprocessable entity", status_code=422)
-        assert error_422.status_code == 422
-
-    def test_with_validation_details(self) -> None:
-        """Test ValidationError with validation details in response."""
-        response: Dict[str, Any] = {
-            "errors": [
-                {"field": "email", "message": "Invalid email format"},
-                {"field": "amount", "message": "Must be positive"},
-            ]
-        }
-        error = ValidationError("Validation failed", status_code=422, response=response)
-        assert error.response == response
-
-
-class TestRateLimitError:
-    """Test cases for RateLimitError."""
+        restored = pickle.loads(pickle.dumps(error))
 
-    def test_inheritance(self) -> None:
-        """Test that RateLimitError inherits from NodelaError."""
-        error = RateLimitError("Rate limit exceeded")
-        assert isinstance(error, NodelaError)
-        assert isinstance(error, RateLimitError)
-
-    def test_with_status_code(self) -> None:
-        """Test RateLimitError with status code 429."""
-        error = RateLimitError("Too many requests", status_code=429)
-        assert str(error) == "Too many requests"
-        assert error.status_code == 429
-
-    def test_with_retry_after(self) -> None:
-        """Test RateLimitError with retry-after information."""
-        response: Dict[str, Any] = {"retry_after": 60}
-        error = RateLimitError("Rate limited", status_code=429, response=response)
-        assert error.response == response
-        assert error.response["retry_after"] == 60
+        assert isinstance(restored, NotFoundError)
+        assert str(restored) == "Not found"
+        assert restored.status_code == 404
+        assert restored.response == {"message": "Not found"}
 
 
-class TestNotFoundError:
-    """Test cases for NotFoundError."""
+class TestSpecificErrors:
+    """Test cases shared by the status-code specific exceptions."""
 
-    def test_inheritance(self) -> None:
-        """Test that NotFoundError inherits from NodelaError."""
-        error = NotFoundError("Resource not found")
-        assert isinstance(error, NodelaError)
-        assert isinstance(error, NotFoundError)
-
-    def test_with_status_code(self) -> None:
-        """Test NotFoundError with status code 404."""
-        error = NotFoundError("Invoice not found", status_code=404)
-        assert str(error) == "Invoice not found"
-        assert error.status_code == 404
-
-    def test_with_resource_details(self) -> None:
-        """Test NotFoundError with resource details."""
-        response: Dict[str, str] = {"resource": "invoice", "id": "inv_123"}
-        error = NotFoundError("Not found", status_code=404, response=response)
-        assert error.response == response
-
-
-class TestServerError:
-    """Test cases for ServerError."""
-
-    def test_inheritance(self) -> None:
-        """Test that ServerError inherits from NodelaError."""
-        error = ServerError("Internal server error")
-        assert isinstance(error, NodelaError)
-        assert isinstance(error, ServerError)
+    @pytest.mark.parametrize("exc_cls, message, status_code, response", EXC_CASES)
+    def test_carries_details(
+        self,
+        exc_cls: Type[NodelaError],
+        message: str,
+        status_code: int,
+        response: Optional[Dict[str, Any]],
+    ) -> None:
+        """Test that message, status code and response data are kept."""
+        error = exc_cls(message, status_code=status_code, response=response)
 
-    def test_with_various_5xx_status_codes(self) -> None:
-        """Test ServerError with various 5xx status codes."""
-        error_500 = ServerError("Internal error", status_code=500)
-        assert error_500.status_code == 500
-
-        error_502 = ServerError("Bad gateway", status_code=502)
-        assert error_502.status_code == 502
-
-        error_503 = ServerError("Service unavailable", status_code=503)
-        assert error_503.status_code == 503
-
-        error_504 = ServerError("Gateway timeout", status_code=504)
-        assert error_504.status_code == 504
-
-    def test_with_error_details(self) -> None:
-        """Test ServerError with error details."""
-        response: Dict[str, str] = {"error_id": "err_xyz789", "timestamp": "2024-01-01T00:00:00Z"}
-        error = ServerError("Server error", status_code=500, response=response)
+        assert isinstance(error, exc_cls)
+        assert str(error) == message
+        assert error.status_code == status_code
         assert error.response == response
 
 
 class TestNetworkError:
     """Test cases for NetworkError."""
 
-    def test_inheritance(self) -> None:
-        """Test that NetworkError inherits from NodelaError."""
-        error = NetworkError("Connection failed")
-        assert isinstance(error, NodelaError)
-        assert isinstance(error, NetworkError)
-
     def test_connection_timeout(self) -> None:
         """Test NetworkError for connection timeout scenarios."""
         error = NetworkError("Request timed out")
@@ -211,20 +145,12 @@ class TestNetworkError:
 class TestExceptionHierarchy:
     """Test cases for exception hierarchy and type checking."""
 
-    def test_all_specific_errors_inherit_from_nodela_error(self) -> None:
-        """Test that all specific exceptions inherit from NodelaError."""
-        exceptions = [
-            AuthenticationError("test"),
-            ValidationError("test"),
-            RateLimitError("test"),
-            NotFoundError("test"),
-            ServerError("test"),
-            NetworkError("test"),
-        ]
-
-        for exc in exceptions:
-            assert isinstance(exc, NodelaError)
-            assert isinstance(exc, Exception)
+    @pytest.mark.parametrize("exc_cls", EXC_CLASSES)
+    def test_inheritance(self, exc_cls: Type[NodelaError]) -> None:
+        """Test that each specific exception inherits from NodelaError."""
+        error = exc_cls("test")
+
+        assert isinstance(error, NodelaError)
 
     def test_exception_catching_hierarchy(self) -> None:
         """Test that exceptions can be caught by parent class."""
@@ -236,10 +162,9 @@ class TestExceptionHierarchy:
 
     def test_specific_exception_catching(self) -> None:
         """Test catching specific exception types."""
-        with pytest.raises(AuthenticationError) as exc_info:
+        with pytest.raises(AuthenticationError, match="Invalid token") as exc_info:
             raise AuthenticationError("Invalid token")
 
-        assert "Invalid token" in str(exc_info.value)
         assert exc_info.value.status_code is None
 
     def test_exception_type_differentiation(self) -> None:
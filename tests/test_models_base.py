@@ -3,10 +3,14 @@
 from typing import Any, Dict, Optional
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 from pydantic import Field
 from pydantic import ValidationError as PydanticValidationError
 
-from nodela.models.base import BaseModel
+from nodela.models.base import BaseModel, RequestBaseModel
+
+pytestmark = pytest.mark.fast
 
 
 class SampleModel(BaseModel):
@@ -26,24 +30,48 @@ class StrictModel(BaseModel):
     price: Optional[float] = Field(None, gt=0)
 
 
+class SampleRequestModel(RequestBaseModel):
+    """Request model for testing assignment validation."""
+
+    id: str
+    count: int
+
+
+@pytest.fixture(scope="module")
+def base_sample() -> SampleModel:
+    """Return a SampleModel with only required fields, shared by the module."""
+    return SampleModel(id="123", name="Test")
+
+
+@pytest.fixture(scope="module")
+def sample_with_age() -> SampleModel:
+    """Return a SampleModel with an age set, shared by the module."""
+    return SampleModel(id="123", name="Test", age=25)
+
+
+@pytest.fixture(scope="module")
+def sample_schema() -> Dict[str, Any]:
+    """Return the JSON schema of SampleModel, generated once per module."""
+    return SampleModel.model_json_schema()
+
+
 class TestBaseModel:
     """Test cases for BaseModel class."""
 
     def test_basic_initialization(self) -> None:
         """Test basic model initialization with required fields."""
         model = SampleModel(id="123", name="Test")
-        assert model.id == "123"
-        assert model.name == "Test"
-        assert model.age is None
-        assert model.email is None
+        assert (model.id, model.name, model.age, model.email) == ("123", "Test", None, None)
 
     def test_initialization_with_optional_fields(self) -> None:
         """Test initialization with optional fields provided."""
         model = SampleModel(id="123", name="Test", age=25, email="test@example.com")
-        assert model.id == "123"
-        assert model.name == "Test"
-        assert model.age == 25
-        assert model.email == "test@example.com"
+        assert (model.id, model.name, model.age, model.email) == (
+            "123",
+            "Test",
+            25,
+            "test@example.com",
+        )
 
     def test_missing_required_field_raises_error(self) -> None:
         """Test that missing required fields raise validation error."""
@@ -53,10 +81,9 @@ class TestBaseModel:
         errors = exc_info.value.errors()
         assert any(error["loc"] == ("name",) for error in errors)
 
-    def test_to_dict_basic(self) -> None:
+    def test_to_dict_basic(self, base_sample: SampleModel) -> None:
         """Test to_dict method with basic data."""
-        model = SampleModel(id="123", name="Test")
-        result = model.to_dict()
+        result = base_sample.to_dict()
 
         assert isinstance(result, dict)
         assert result == {"id": "123", "name": "Test"}
@@ -77,14 +104,17 @@ class TestBaseModel:
         assert "email" not in result
         assert result == {"id": "123", "name": "Test"}
 
+    def test_to_dict_matches_model_dump(self, sample_with_age: SampleModel) -> None:
+        """Test that to_dict returns exactly model_dump(exclude_none=True)."""
+        assert sample_with_age.to_dict() == sample_with_age.model_dump(exclude_none=True)
+
     def test_from_dict_basic(self) -> None:
         """Test from_dict class method with basic data."""
         data: Dict[str, Any] = {"id": "123", "name": "Test"}
         model = SampleModel.from_dict(data)
 
         assert isinstance(model, SampleModel)
-        assert model.id == "123"
-        assert model.name == "Test"
+        assert (model.id, model.name) == ("123", "Test")
 
     def test_from_dict_with_optional_fields(self) -> None:
         """Test from_dict with optional fields."""
@@ -96,10 +126,12 @@ class TestBaseModel:
         }
         model = SampleModel.from_dict(data)
 
-        assert model.id == "456"
-        assert model.name == "Another Test"
-        assert model.age == 30
-        assert model.email == "another@example.com"
+        assert (model.id, model.name, model.age, model.email) == (
+            "456",
+            "Another Test",
+            30,
+            "another@example.com",
+        )
 
     def test_from_dict_invalid_data_raises_error(self) -> None:
         """Test from_dict with invalid data raises error."""
@@ -108,125 +140,113 @@ class TestBaseModel:
         with pytest.raises(PydanticValidationError):
             SampleModel.from_dict(data)
 
-    def test_to_dict_from_dict_roundtrip(self) -> None:
+    @given(
+        id_=st.text(min_size=1, max_size=20),
+        name=st.text(min_size=1, max_size=20),
+        age=st.one_of(st.none(), st.integers(0, 120)),
+    )
+    @settings(max_examples=20, deadline=None)
+    def test_to_dict_from_dict_roundtrip(self, id_: str, name: str, age: Optional[int]) -> None:
         """Test that to_dict and from_dict are reversible."""
-        original = SampleModel(id="789", name="Roundtrip Test", age=40)
-        dict_data = original.to_dict()
-        restored = SampleModel.from_dict(dict_data)
+        original = SampleModel(id=id_, name=name, age=age)
 
-        assert restored.id == original.id
-        assert restored.name == original.name
-        assert restored.age == original.age
+        assert SampleModel.from_dict(original.to_dict()) == original
 
-    def test_extra_fields_allowed(self) -> None:
-        """Test that extra fields are allowed per model config."""
+    def test_extra_fields_ignored(self) -> None:
+        """Test that unknown fields are accepted but not kept."""
         data: Dict[str, Any] = {"id": "123", "name": "Test", "extra_field": "extra_value"}
         model = SampleModel.from_dict(data)
 
-        # Model should accept extra fields
-        assert model.id == "123"
-        assert model.name == "Test"
+        assert (model.id, model.name) == ("123", "Test")
+        assert not hasattr(model, "extra_field")
+        assert model.to_dict() == {"id": "123", "name": "Test"}
 
     def test_field_validation(self) -> None:
         """Test field validation with constraints."""
         # Valid data
         model = StrictModel(id="test_id", count=5, price=10.5)
-        assert model.id == "test_id"
-        assert model.count == 5
-        assert model.price == 10.5
-
-    def test_field_validation_min_length(self) -> None:
-        """Test min_length validation."""
+        assert (model.id, model.count, model.price) == ("test_id", 5, 10.5)
+
+    @pytest.mark.parametrize(
+        "kwargs, field",
+        [
+            ({"id": "", "count": 5}, "id"),
+            ({"id": "test", "count": -1}, "count"),
+            ({"id": "test", "count": 5, "price": 0}, "price"),
+            ({"id": "test", "count": 5, "price": -10.5}, "price"),
+        ],
+        ids=("min_length", "greater_equal", "greater_than_zero", "greater_than_negative"),
+    )
+    def test_field_validation_rejects(self, kwargs: Dict[str, Any], field: str) -> None:
+        """Test that field constraints reject out-of-range values."""
         with pytest.raises(PydanticValidationError) as exc_info:
-            StrictModel(id="", count=5)
+            StrictModel(**kwargs)
 
         errors = exc_info.value.errors()
-        assert any("id" in str(error["loc"]) for error in errors)
+        assert any(error["loc"] == (field,) for error in errors)
 
-    def test_field_validation_greater_equal(self) -> None:
-        """Test greater-than-or-equal validation."""
-        with pytest.raises(PydanticValidationError):
-            StrictModel(id="test", count=-1)
+    def test_assignment_not_validated(self, base_sample: SampleModel) -> None:
+        """Test that response models skip validation on assignment."""
+        model = base_sample.model_copy()
 
-    def test_field_validation_greater_than(self) -> None:
-        """Test greater-than validation for price."""
-        with pytest.raises(PydanticValidationError):
-            StrictModel(id="test", count=5, price=0)
+        model.name = "Updated Name"
+        assert model.name == "Updated Name"
 
-        with pytest.raises(PydanticValidationError):
-            StrictModel(id="test", count=5, price=-10.5)
+        model.age = "not an int"  # type: ignore
+        assert model.age == "not an int"
 
-    def test_validate_assignment(self) -> None:
-        """Test that assignment validation is enabled."""
-        model = SampleModel(id="123", name="Test")
+    def test_request_model_validates_assignment(self) -> None:
+        """Test that request models keep assignment validation enabled."""
+        model = SampleRequestModel(id="123", count=1)
 
-        # This should work
-        model.name = "Updated Name"
-        assert model.name == "Updated Name"
+        model.count = 2
+        assert model.count == 2
 
-    def test_populate_by_name(self) -> None:
-        """Test populate_by_name config option."""
-        # This is more relevant for models with field aliases
-        data: Dict[str, str] = {"id": "123", "name": "Test"}
-        model = SampleModel(**data)
-        assert model.id == "123"
-        assert model.name == "Test"
+        with pytest.raises(PydanticValidationError):
+            model.count = "not an int"  # type: ignore
 
-    def test_model_equality(self) -> None:
+    def test_model_equality(self, sample_with_age: SampleModel) -> None:
         """Test model equality comparison."""
-        model1 = SampleModel(id="123", name="Test", age=25)
+        model1 = sample_with_age
         model2 = SampleModel(id="123", name="Test", age=25)
         model3 = SampleModel(id="123", name="Different", age=25)
 
         assert model1 == model2
         assert model1 != model3
 
-    def test_model_copy(self) -> None:
+    def test_model_copy(self, sample_with_age: SampleModel) -> None:
         """Test model copy functionality."""
-        original = SampleModel(id="123", name="Test", age=25)
+        original = sample_with_age
         copied = original.model_copy()
 
-        assert copied.id == original.id
-        assert copied.name == original.name
-        assert copied.age == original.age
+        assert (copied.id, copied.name, copied.age) == (original.id, original.name, original.age)
         assert copied is not original
 
-    def test_model_copy_with_update(self) -> None:
+    def test_model_copy_with_update(self, sample_with_age: SampleModel) -> None:
         """Test model copy with updates."""
-        original = SampleModel(id="123", name="Test", age=25)
+        original = sample_with_age
         updated = original.model_copy(update={"name": "Updated", "age": 30})
 
-        assert updated.id == "123"
-        assert updated.name == "Updated"
-        assert updated.age == 30
-        assert original.name == "Test"  # Original unchanged
-        assert original.age == 25
+        assert (updated.id, updated.name, updated.age) == ("123", "Updated", 30)
+        assert (original.name, original.age) == ("Test", 25)  # Original unchanged
 
-    def test_model_dump(self) -> None:
+    def test_model_dump(self, sample_with_age: SampleModel) -> None:
         """Test model_dump method."""
-        model = SampleModel(id="123", name="Test", age=25)
-        dumped = model.model_dump()
+        dumped = sample_with_age.model_dump()
 
         assert dumped == {"id": "123", "name": "Test", "age": 25, "email": None}
 
-    def test_model_dump_exclude_none(self) -> None:
+    def test_model_dump_exclude_none(self, base_sample: SampleModel) -> None:
         """Test model_dump with exclude_none."""
-        model = SampleModel(id="123", name="Test")
-        dumped = model.model_dump(exclude_none=True)
+        dumped = base_sample.model_dump(exclude_none=True)
 
         assert dumped == {"id": "123", "name": "Test"}
         assert "age" not in dumped
         assert "email" not in dumped
 
-    def test_model_json_schema(self) -> None:
+    def test_model_json_schema(self, sample_schema: Dict[str, Any]) -> None:
         """Test that model can generate JSON schema."""
-        schema = SampleModel.model_json_schema()
-
-        assert "properties" in schema
-        assert "id" in schema["properties"]
-        assert "name" in schema["properties"]
-        assert "age" in schema["properties"]
-        assert "email" in schema["properties"]
-        assert "required" in schema
-        assert "id" in schema["required"]
-        assert "name" in schema["required"]
+        schema = sample_schema
+
+        assert schema["properties"].keys() == {"id", "name", "age", "email"}
+        assert set(schema["required"]) == {"id", "name"}
@@ -1,12 +1,14 @@
 """Unit tests for invoice models."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List, Tuple, Type, get_args
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
+from nodela.models.base import BaseModel
 from nodela.models.invoice import (
     SUPPORTED_CURRENCIES,
+    SUPPORTED_CURRENCIES_SET,
     CreateInvoiceData,
     CreateInvoiceParams,
     CreateInvoiceResponse,
@@ -14,10 +16,137 @@ from nodela.models.invoice import (
     CustomerParams,
     ErrorDetail,
     PaymentInfo,
+    SupportedCurrency,
     VerifyInvoiceData,
     VerifyInvoiceResponse,
 )
 
+pytestmark = pytest.mark.fast
+
+# Built once from the list under test, for membership and duplicate checks.
+_CURRENCIES_SET: FrozenSet[str] = frozenset(SUPPORTED_CURRENCIES)
+
+# Canonical payloads shared by the from_dict tests; copy before mutating.
+_CREATE_INVOICE_DATA_DICT: Dict[str, Any] = {
+    "id": "inv_123",
+    "invoice_id": "INV-001",
+    "original_amount": "100.00",
+    "original_currency": "USD",
+    "amount": "100.00",
+    "currency": "USDC",
+    "checkout_url": "https://checkout.nodela.co/inv_123",
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+_VERIFY_INVOICE_DATA_DICT: Dict[str, Any] = {
+    "id": "inv_123",
+    "invoice_id": "INV-001",
+    "original_amount": "100.00",
+    "original_currency": "USD",
+    "amount": 100.0,
+    "currency": "USDC",
+    "status": "pending",
+    "paid": False,
+    "created_at": "2024-01-01T00:00:00Z",
+}
+
+_PAID_VERIFY_INVOICE_DATA_DICT: Dict[str, Any] = {
+    **_VERIFY_INVOICE_DATA_DICT,
+    "status": "completed",
+    "paid": True,
+}
+
+_PAYMENT_DICT: Dict[str, Any] = {
+    "id": "pay_123",
+    "network": "polygon",
+    "token": "USDC",
+    "address": "0x1234",
+    "amount": 100.0,
+    "status": "confirmed",
+    "tx_hash": ["0xhash"],
+    "transaction_type": "payment",
+    "payer_email": "payer@example.com",
+    "created_at": "2024-01-01T00:05:00Z",
+}
+
+
+# Every CreateInvoiceParams field set, as to_dict() returns it.
+_FULL_INVOICE_PARAMS_DICT: Dict[str, Any] = {
+    "amount": 250.50,
+    "currency": "EUR",
+    "success_url": "https://example.com/success",
+    "cancel_url": "https://example.com/cancel",
+    "webhook_url": "https://example.com/webhook",
+    "reference": "ORDER-123",
+    "customer": {"email": "test@example.com", "name": "Test User"},
+    "title": "Test Invoice",
+    "description": "Test invoice description",
+}
+
+_CREATE_INVOICE_SUCCESS_DICT: Dict[str, Any] = {"success": True, "data": _CREATE_INVOICE_DATA_DICT}
+
+_CREATE_INVOICE_ERROR_DICT: Dict[str, Any] = {
+    "success": False,
+    "error": {"code": "validation_error", "message": "Invalid input"},
+}
+
+_VERIFY_WITH_PAYMENT_DICT: Dict[str, Any] = {
+    "success": True,
+    "data": {**_PAID_VERIFY_INVOICE_DATA_DICT, "payment": _PAYMENT_DICT},
+}
+
+# (model class, constructor kwargs, expected to_dict output) for the simple models.
+_TO_DICT_CASES: List[Tuple[Type[BaseModel], Dict[str, Any], Dict[str, Any]]] = [
+    (CustomerParams, {"email": "test@example.com"}, {"email": "test@example.com"}),
+    (
+        CustomerParams,
+        {"email": "test@example.com", "name": "Test User"},
+        {"email": "test@example.com", "name": "Test User"},
+    ),
+    (
+        CreateInvoiceParams,
+        {"amount": 100.0, "currency": "USD"},
+        {"amount": 100.0, "currency": "USD"},
+    ),
+    (
+        ErrorDetail,
+        {"code": "validation_error", "message": "Invalid input"},
+        {"code": "validation_error", "message": "Invalid input"},
+    ),
+    (CustomerInfo, {"email": "test@example.com"}, {"email": "test@example.com"}),
+    (
+        CustomerInfo,
+        {"email": "test@example.com", "name": "Test User"},
+        {"email": "test@example.com", "name": "Test User"},
+    ),
+]
+
+
+# The fixtures below feed trusted data into other models, so they skip validation
+# with model_construct. Tests that check validation build their models normally.
+@pytest.fixture(scope="module")
+def customer_info() -> CustomerInfo:
+    """Return a CustomerInfo with email and name, shared by the module."""
+    return CustomerInfo.model_construct(email="test@example.com", name="Test User")
+
+
+@pytest.fixture(scope="module")
+def payment_info() -> PaymentInfo:
+    """Return a confirmed PaymentInfo, shared by the module."""
+    return PaymentInfo.model_construct(**_PAYMENT_DICT)
+
+
+@pytest.fixture(scope="module")
+def create_invoice_data() -> CreateInvoiceData:
+    """Return a CreateInvoiceData with only required fields, shared by the module."""
+    return CreateInvoiceData.model_construct(**_CREATE_INVOICE_DATA_DICT)
+
+
+@pytest.fixture(scope="module")
+def paid_invoice_data() -> VerifyInvoiceData:
+    """Return a paid VerifyInvoiceData without payment details, shared by the module."""
+    return VerifyInvoiceData.model_construct(**_PAID_VERIFY_INVOICE_DATA_DICT)
+
 
 class TestSupportedCurrencies:
     """Test cases for supported currencies constants."""
@@ -32,72 +161,78 @@ class TestSupportedCurrencies:
 
     def test_major_currencies_included(self) -> None:
         """Test that major currencies are included."""
-        assert "USD" in SUPPORTED_CURRENCIES
-        assert "EUR" in SUPPORTED_CURRENCIES
-        assert "GBP" in SUPPORTED_CURRENCIES
-        assert "JPY" in SUPPORTED_CURRENCIES
+        assert "USD" in _CURRENCIES_SET
+        assert "EUR" in _CURRENCIES_SET
+        assert "GBP" in _CURRENCIES_SET
+        assert "JPY" in _CURRENCIES_SET
 
-    def test_all_currencies_uppercase(self) -> None:
-        """Test that all currencies are uppercase."""
-        for currency in SUPPORTED_CURRENCIES:
-            assert currency == currency.upper()
-            assert len(currency) == 3  # ISO 4217 standard
+    @pytest.mark.parametrize("currency", SUPPORTED_CURRENCIES)
+    def test_currency_is_iso4217(self, currency: str) -> None:
+        """Test that each currency is a three-letter uppercase ISO 4217 code."""
+        assert currency.isupper() and len(currency) == 3
 
     def test_no_duplicates(self) -> None:
         """Test that there are no duplicate currencies."""
-        assert len(SUPPORTED_CURRENCIES) == len(set(SUPPORTED_CURRENCIES))
-
-
-class TestCustomerParams:
-    """Test cases for CustomerParams model."""
-
-    def test_basic_initialization(self) -> None:
-        """Test initialization with required email field."""
-        customer = CustomerParams(email="test@example.com")
-        assert customer.email == "test@example.com"
-        assert customer.name is None
-
-    def test_initialization_with_name(self) -> None:
-        """Test initialization with name field."""
-        customer = CustomerParams(email="test@example.com", name="Test User")
-        assert customer.email == "test@example.com"
-        assert customer.name == "Test User"
-
-    def test_missing_email_raises_error(self) -> None:
-        """Test that missing email raises validation error."""
-        with pytest.raises(PydanticValidationError):
-            CustomerParams()  # type: ignore
-
-    def test_to_dict(self) -> None:
-        """Test to_dict method."""
-        customer = CustomerParams(email="test@example.com", name="Test User")
-        result = customer.to_dict()
-        assert result == {"email": "test@example.com", "name": "Test User"}
-
-    def test_to_dict_without_name(self) -> None:
-        """Test to_dict excludes None name."""
-        customer = CustomerParams(email="test@example.com")
-        result = customer.to_dict()
-        assert result == {"email": "test@example.com"}
-        assert "name" not in result
+        assert len(SUPPORTED_CURRENCIES) == len(_CURRENCIES_SET)
+
+    def test_supported_currencies_set_matches_list(self) -> None:
+        """Test that the lookup set holds exactly the listed currencies."""
+        assert isinstance(SUPPORTED_CURRENCIES_SET, frozenset)
+        assert SUPPORTED_CURRENCIES_SET == _CURRENCIES_SET
+
+    def test_supported_currencies_match_literal(self) -> None:
+        """Test that the runtime list and the SupportedCurrency type agree."""
+        assert tuple(SUPPORTED_CURRENCIES) == get_args(SupportedCurrency)
+
+
+class TestModelRoundtrip:
+    """Test cases shared by the simple invoice models."""
+
+    @pytest.mark.parametrize(
+        "model_cls, kwargs, expected",
+        _TO_DICT_CASES,
+        ids=(
+            "customer_params_minimal",
+            "customer_params_with_name",
+            "create_invoice_params_minimal",
+            "error_detail",
+            "customer_info_minimal",
+            "customer_info_with_name",
+        ),
+    )
+    def test_roundtrip(
+        self, model_cls: Type[BaseModel], kwargs: Dict[str, Any], expected: Dict[str, Any]
+    ) -> None:
+        """Test that construction serializes to the expected dict and back, dropping None."""
+        model = model_cls(**kwargs)
+
+        assert model.to_dict() == expected
+        assert model_cls.from_dict(expected) == model
+
+
+class TestMissingRequiredFields:
+    """Test cases for required fields of the invoice request models."""
+
+    @pytest.mark.parametrize(
+        "model_cls, kwargs, field",
+        [
+            (CustomerParams, {}, "email"),
+            (CreateInvoiceParams, {"currency": "USD"}, "amount"),
+            (CreateInvoiceParams, {"amount": 100.0}, "currency"),
+        ],
+        ids=("customer_email", "invoice_amount", "invoice_currency"),
+    )
+    def test_missing_required(
+        self, model_cls: Type[BaseModel], kwargs: Dict[str, Any], field: str
+    ) -> None:
+        """Test that omitting a required field raises a validation error naming it."""
+        with pytest.raises(PydanticValidationError, match=field):
+            model_cls(**kwargs)
 
 
 class TestCreateInvoiceParams:
     """Test cases for CreateInvoiceParams model."""
 
-    def test_minimal_initialization(self) -> None:
-        """Test initialization with only required fields."""
-        params = CreateInvoiceParams(amount=100.0, currency="USD")
-        assert params.amount == 100.0
-        assert params.currency == "USD"
-        assert params.success_url is None
-        assert params.cancel_url is None
-        assert params.webhook_url is None
-        assert params.reference is None
-        assert params.customer is None
-        assert params.title is None
-        assert params.description is None
-
     def test_full_initialization(self) -> None:
         """Test initialization with all fields."""
         customer = CustomerParams(email="test@example.com", name="Test User")
@@ -113,31 +248,13 @@ class TestCreateInvoiceParams:
             description="Test invoice description",
         )
 
-        assert params.amount == 250.50
-        assert params.currency == "EUR"
-        assert params.success_url == "https://example.com/success"
-        assert params.cancel_url == "https://example.com/cancel"
-        assert params.webhook_url == "https://example.com/webhook"
-        assert params.reference == "ORDER-123"
-        assert params.customer == customer
-        assert params.title == "Test Invoice"
-        assert params.description == "Test invoice description"
-
-    def test_missing_amount_raises_error(self) -> None:
-        """Test that missing amount raises validation error."""
-        with pytest.raises(PydanticValidationError):
-            CreateInvoiceParams(currency="USD")  # type: ignore
-
-    def test_missing_currency_raises_error(self) -> None:
-        """Test that missing currency raises validation error."""
-        with pytest.raises(PydanticValidationError):
-            CreateInvoiceParams(amount=100.0)  # type: ignore
+        assert params.to_dict() == _FULL_INVOICE_PARAMS_DICT
 
-    def test_to_dict_minimal(self) -> None:
-        """Test to_dict with minimal data."""
+    def test_assignment_is_validated(self) -> None:
+        """Test that assigning an unsupported currency raises validation error."""
         params = CreateInvoiceParams(amount=100.0, currency="USD")
-        result = params.to_dict()
-        assert result == {"amount": 100.0, "currency": "USD"}
+        with pytest.raises(PydanticValidationError):
+            params.currency = "XYZ"  # type: ignore
 
     def test_to_dict_full(self) -> None:
         """Test to_dict with all fields."""
@@ -150,46 +267,16 @@ class TestCreateInvoiceParams:
             customer=customer,
             title="Invoice Title",
         )
-        result = params.to_dict()
-
-        assert result["amount"] == 100.0
-        assert result["currency"] == "USD"
-        assert result["success_url"] == "https://example.com/success"
-        assert result["reference"] == "REF-001"
-        assert result["customer"] == {"email": "test@example.com", "name": "Test User"}
-        assert result["title"] == "Invoice Title"
-
-
-class TestErrorDetail:
-    """Test cases for ErrorDetail model."""
-
-    def test_initialization(self) -> None:
-        """Test ErrorDetail initialization."""
-        error = ErrorDetail(code="validation_error", message="Invalid input")
-        assert error.code == "validation_error"
-        assert error.message == "Invalid input"
-
-    def test_to_dict(self) -> None:
-        """Test ErrorDetail to_dict."""
-        error = ErrorDetail(code="auth_error", message="Unauthorized")
-        result = error.to_dict()
-        assert result == {"code": "auth_error", "message": "Unauthorized"}
-
-
-class TestCustomerInfo:
-    """Test cases for CustomerInfo model."""
-
-    def test_initialization_with_name(self) -> None:
-        """Test CustomerInfo initialization."""
-        customer = CustomerInfo(email="test@example.com", name="Test User")
-        assert customer.email == "test@example.com"
-        assert customer.name == "Test User"
+        expected = {
+            "amount": 100.0,
+            "currency": "USD",
+            "success_url": "https://example.com/success",
+            "reference": "REF-001",
+            "customer": {"email": "test@example.com", "name": "Test User"},
+            "title": "Invoice Title",
+        }
 
-    def test_initialization_without_name(self) -> None:
-        """Test CustomerInfo with optional name."""
-        customer = CustomerInfo(email="test@example.com")
-        assert customer.email == "test@example.com"
-        assert customer.name is None
+        assert params.to_dict() == expected
 
 
 class TestCreateInvoiceData:
@@ -208,51 +295,31 @@ class TestCreateInvoiceData:
             created_at="2024-01-01T00:00:00Z",
         )
 
-        assert data.id == "inv_123"
-        assert data.invoice_id == "INV-001"
-        assert data.original_amount == "100.00"
-        assert data.original_currency == "USD"
-        assert data.amount == "100.00"
-        assert data.currency == "USDC"
-        assert data.checkout_url == "https://checkout.nodela.co/inv_123"
-        assert data.created_at == "2024-01-01T00:00:00Z"
+        assert data.to_dict() == _CREATE_INVOICE_DATA_DICT
 
-    def test_full_initialization(self) -> None:
+    def test_full_initialization(self, customer_info: CustomerInfo) -> None:
         """Test initialization with all fields."""
-        customer = CustomerInfo(email="test@example.com", name="Test User")
         data = CreateInvoiceData(
-            id="inv_123",
-            invoice_id="INV-001",
-            original_amount="100.00",
-            original_currency="USD",
-            amount="100.00",
-            currency="USDC",
+            **_CREATE_INVOICE_DATA_DICT,
             exchange_rate="1.0",
             webhook_url="https://example.com/webhook",
-            customer=customer,
-            checkout_url="https://checkout.nodela.co/inv_123",
+            customer=customer_info,
             status="pending",
-            created_at="2024-01-01T00:00:00Z",
         )
 
-        assert data.exchange_rate == "1.0"
-        assert data.webhook_url == "https://example.com/webhook"
-        assert data.customer == customer
-        assert data.status == "pending"
+        expected = {
+            **_CREATE_INVOICE_DATA_DICT,
+            "exchange_rate": "1.0",
+            "webhook_url": "https://example.com/webhook",
+            "customer": {"email": "test@example.com", "name": "Test User"},
+            "status": "pending",
+        }
+
+        assert data.to_dict() == expected
 
     def test_from_dict(self) -> None:
         """Test creating from dictionary."""
-        dict_data: Dict[str, Any] = {
-            "id": "inv_123",
-            "invoice_id": "INV-001",
-            "original_amount": "100.00",
-            "original_currency": "USD",
-            "amount": "100.00",
-            "currency": "USDC",
-            "checkout_url": "https://checkout.nodela.co/inv_123",
-            "created_at": "2024-01-01T00:00:00Z",
-        }
-        data = CreateInvoiceData.from_dict(dict_data)
+        data = CreateInvoiceData.from_dict(_CREATE_INVOICE_DATA_DICT)
 
         assert data.id == "inv_123"
         assert data.invoice_id == "INV-001"
@@ -261,22 +328,12 @@ class TestCreateInvoiceData:
 class TestCreateInvoiceResponse:
     """Test cases for CreateInvoiceResponse model."""
 
-    def test_successful_response(self) -> None:
+    def test_successful_response(self, create_invoice_data: CreateInvoiceData) -> None:
         """Test successful invoice creation response."""
-        invoice_data = CreateInvoiceData(
-            id="inv_123",
-            invoice_id="INV-001",
-            original_amount="100.00",
-            original_currency="USD",
-            amount="100.00",
-            currency="USDC",
-            checkout_url="https://checkout.nodela.co/inv_123",
-            created_at="2024-01-01T00:00:00Z",
-        )
-        response = CreateInvoiceResponse(success=True, data=invoice_data)
+        response = CreateInvoiceResponse(success=True, data=create_invoice_data)
 
         assert response.success is True
-        assert response.data == invoice_data
+        assert response.data == create_invoice_data
         assert response.error is None
 
     def test_error_response(self) -> None:
@@ -290,20 +347,7 @@ class TestCreateInvoiceResponse:
 
     def test_from_dict_success(self) -> None:
         """Test creating successful response from dict."""
-        dict_data: Dict[str, Any] = {
-            "success": True,
-            "data": {
-                "id": "inv_123",
-                "invoice_id": "INV-001",
-                "original_amount": "100.00",
-                "original_currency": "USD",
-                "amount": "100.00",
-                "currency": "USDC",
-                "checkout_url": "https://checkout.nodela.co/inv_123",
-                "created_at": "2024-01-01T00:00:00Z",
-            },
-        }
-        response = CreateInvoiceResponse.from_dict(dict_data)
+        response = CreateInvoiceResponse.from_dict(_CREATE_INVOICE_SUCCESS_DICT)
 
         assert response.success is True
         assert response.data is not None
@@ -311,11 +355,7 @@ class TestCreateInvoiceResponse:
 
     def test_from_dict_error(self) -> None:
         """Test creating error response from dict."""
-        dict_data: Dict[str, Any] = {
-            "success": False,
-            "error": {"code": "validation_error", "message": "Invalid input"},
-        }
-        response = CreateInvoiceResponse.from_dict(dict_data)
+        response = CreateInvoiceResponse.from_dict(_CREATE_INVOICE_ERROR_DICT)
 
         assert response.success is False
         assert response.error is not None
@@ -353,7 +393,7 @@ class TestPaymentInfo:
 
     def test_multiple_tx_hashes(self) -> None:
         """Test PaymentInfo with multiple transaction hashes."""
-        tx_hashes: List[str] = ["0xhash1", "0xhash2", "0xhash3"]
+        tx_hashes = ["0xhash1", "0xhash2", "0xhash3"]
         payment = PaymentInfo(
             id="pay_123",
             network="ethereum",
@@ -388,27 +428,12 @@ class TestVerifyInvoiceData:
             created_at="2024-01-01T00:00:00Z",
         )
 
-        assert data.id == "inv_123"
-        assert data.invoice_id == "INV-001"
-        assert data.paid is False
-        assert data.payment is None
+        assert data.to_dict() == _VERIFY_INVOICE_DATA_DICT
 
-    def test_initialization_with_payment(self) -> None:
+    def test_initialization_with_payment(
+        self, customer_info: CustomerInfo, payment_info: PaymentInfo
+    ) -> None:
         """Test initialization for paid invoice."""
-        customer = CustomerInfo(email="test@example.com", name="Test User")
-        payment = PaymentInfo(
-            id="pay_123",
-            network="polygon",
-            token="USDC",
-            address="0x1234",
-            amount=100.0,
-            status="confirmed",
-            tx_hash=["0xhash"],
-            transaction_type="payment",
-            payer_email="payer@example.com",
-            created_at="2024-01-01T00:05:00Z",
-        )
-
         data = VerifyInvoiceData(
             id="inv_123",
             invoice_id="INV-001",
@@ -422,31 +447,26 @@ class TestVerifyInvoiceData:
             description="Test Description",
             status="completed",
             paid=True,
-            customer=customer,
+            customer=customer_info,
             created_at="2024-01-01T00:00:00Z",
-            payment=payment,
+            payment=payment_info,
         )
 
-        assert data.paid is True
-        assert data.payment == payment
-        assert data.customer == customer
-        assert data.reference == "ORDER-001"
-        assert data.title == "Test Invoice"
+        expected = {
+            **_PAID_VERIFY_INVOICE_DATA_DICT,
+            "reference": "ORDER-001",
+            "exchange_rate": 1.0,
+            "title": "Test Invoice",
+            "description": "Test Description",
+            "customer": {"email": "test@example.com", "name": "Test User"},
+            "payment": _PAYMENT_DICT,
+        }
+
+        assert data.to_dict() == expected
 
     def test_from_dict(self) -> None:
         """Test creating from dictionary."""
-        dict_data: Dict[str, Any] = {
-            "id": "inv_123",
-            "invoice_id": "INV-001",
-            "original_amount": "100.00",
-            "original_currency": "USD",
-            "amount": 100.0,
-            "currency": "USDC",
-            "status": "pending",
-            "paid": False,
-            "created_at": "2024-01-01T00:00:00Z",
-        }
-        data = VerifyInvoiceData.from_dict(dict_data)
+        data = VerifyInvoiceData.from_dict(_VERIFY_INVOICE_DATA_DICT)
 
         assert data.id == "inv_123"
         assert data.paid is False
@@ -455,23 +475,12 @@ class TestVerifyInvoiceData:
 class TestVerifyInvoiceResponse:
     """Test cases for VerifyInvoiceResponse model."""
 
-    def test_successful_response(self) -> None:
+    def test_successful_response(self, paid_invoice_data: VerifyInvoiceData) -> None:
         """Test successful verification response."""
-        invoice_data = VerifyInvoiceData(
-            id="inv_123",
-            invoice_id="INV-001",
-            original_amount="100.00",
-            original_currency="USD",
-            amount=100.0,
-            currency="USDC",
-            status="completed",
-            paid=True,
-            created_at="2024-01-01T00:00:00Z",
-        )
-        response = VerifyInvoiceResponse(success=True, data=invoice_data)
+        response = VerifyInvoiceResponse(success=True, data=paid_invoice_data)
 
         assert response.success is True
-        assert response.data == invoice_data
+        assert response.data == paid_invoice_data
         assert response.error is None
 
     def test_error_response(self) -> None:
@@ -485,33 +494,7 @@ class TestVerifyInvoiceResponse:
 
     def test_from_dict_with_payment(self) -> None:
         """Test creating response from dict with payment data."""
-        dict_data: Dict[str, Any] = {
-            "success": True,
-            "data": {
-                "id": "inv_123",
-                "invoice_id": "INV-001",
-                "original_amount": "100.00",
-                "original_currency": "USD",
-                "amount": 100.0,
-                "currency": "USDC",
-                "status": "completed",
-                "paid": True,
-                "created_at": "2024-01-01T00:00:00Z",
-                "payment": {
-                    "id": "pay_123",
-                    "network": "polygon",
-                    "token": "USDC",
-                    "address": "0x1234",
-                    "amount": 100.0,
-                    "status": "confirmed",
-                    "tx_hash": ["0xhash"],
-                    "transaction_type": "payment",
-                    "payer_email": "payer@example.com",
-                    "created_at": "2024-01-01T00:05:00Z",
-                },
-            },
-        }
-        response = VerifyInvoiceResponse.from_dict(dict_data)
+        response = VerifyInvoiceResponse.from_dict(_VERIFY_WITH_PAYMENT_DICT)
 
         assert response.success is True
         assert response.data is not None
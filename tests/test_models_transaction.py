@@ -1,10 +1,12 @@
 """Unit tests for transaction models."""
 
+from array import array
 from typing import Any, Dict, List
 
 import pytest
 from pydantic import ValidationError as PydanticValidationError
 
+from nodela.models.invoice import PaymentInfo
 from nodela.models.transaction import (
     ListTransactionsData,
     ListTransactionsResponse,
@@ -14,6 +16,63 @@ from nodela.models.transaction import (
     TransactionPayment,
 )
 
+pytestmark = pytest.mark.fast
+
+
+# Shared, read-only instances for tests that only serialize or nest them. Tests
+# that check construction or validation build their own models.
+@pytest.fixture(scope="module")
+def sample_customer() -> TransactionCustomer:
+    """Return a TransactionCustomer, shared by the module."""
+    return TransactionCustomer(email="test@example.com", name="Test User")
+
+
+@pytest.fixture(scope="module")
+def sample_payment() -> TransactionPayment:
+    """Return a confirmed TransactionPayment, shared by the module."""
+    return TransactionPayment(
+        id="pay_123",
+        network="polygon",
+        token="USDC",
+        address="0x1234",
+        amount=100.0,
+        status="confirmed",
+        tx_hash=["0xhash"],
+        transaction_type="payment",
+        payer_email="payer@example.com",
+        created_at="2024-01-01T00:05:00Z",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_transaction(
+    sample_customer: TransactionCustomer, sample_payment: TransactionPayment
+) -> Transaction:
+    """Return a completed Transaction, shared by the module."""
+    return Transaction(
+        id="txn_123",
+        invoice_id="INV-001",
+        reference="ORDER-001",
+        original_amount=100.0,
+        original_currency="USD",
+        amount=100.0,
+        currency="USDC",
+        exchange_rate=1.0,
+        title="Test",
+        description="Desc",
+        status="completed",
+        paid=True,
+        customer=sample_customer,
+        created_at="2024-01-01T00:00:00Z",
+        payment=sample_payment,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_pagination() -> Pagination:
+    """Return a single-page Pagination holding one result, shared by the module."""
+    return Pagination(page=1, limit=10, total=1, total_pages=1, has_more=False)
+
 
 class TestTransactionCustomer:
     """Test cases for TransactionCustomer model."""
@@ -34,10 +93,9 @@ class TestTransactionCustomer:
         with pytest.raises(PydanticValidationError):
             TransactionCustomer(email="test@example.com")  # type: ignore
 
-    def test_to_dict(self) -> None:
+    def test_to_dict(self, sample_customer: TransactionCustomer) -> None:
         """Test to_dict method."""
-        customer = TransactionCustomer(email="test@example.com", name="Test User")
-        result = customer.to_dict()
+        result = sample_customer.to_dict()
         assert result == {"email": "test@example.com", "name": "Test User"}
 
     def test_from_dict(self) -> None:
@@ -51,6 +109,10 @@ class TestTransactionCustomer:
 class TestTransactionPayment:
     """Test cases for TransactionPayment model."""
 
+    def test_shared_with_invoice_payment(self) -> None:
+        """Test that TransactionPayment is the same model as PaymentInfo."""
+        assert TransactionPayment is PaymentInfo
+
     def test_initialization(self) -> None:
         """Test TransactionPayment initialization."""
         payment = TransactionPayment(
@@ -114,21 +176,9 @@ class TestTransactionPayment:
         assert payment.tx_hash == []
         assert len(payment.tx_hash) == 0
 
-    def test_to_dict(self) -> None:
+    def test_to_dict(self, sample_payment: TransactionPayment) -> None:
         """Test to_dict method."""
-        payment = TransactionPayment(
-            id="pay_123",
-            network="polygon",
-            token="USDC",
-            address="0x1234",
-            amount=100.0,
-            status="confirmed",
-            tx_hash=["0xhash"],
-            transaction_type="payment",
-            payer_email="payer@example.com",
-            created_at="2024-01-01T00:00:00Z",
-        )
-        result = payment.to_dict()
+        result = sample_payment.to_dict()
 
         assert result["id"] == "pay_123"
         assert result["network"] == "polygon"
@@ -203,9 +253,10 @@ class TestTransaction:
         assert transaction.description == "Test Description"
         assert transaction.status == "completed"
         assert transaction.paid is True
-        assert transaction.customer == customer
         assert transaction.created_at == "2024-01-01T00:00:00Z"
-        assert transaction.payment == payment
+        # Nested model instances are kept as-is, not revalidated or copied.
+        assert transaction.customer is customer
+        assert transaction.payment is payment
 
     def test_missing_required_fields_raises_error(self) -> None:
         """Test that missing required fields raise validation errors."""
@@ -216,41 +267,9 @@ class TestTransaction:
                 # Missing many required fields
             )
 
-    def test_to_dict(self) -> None:
+    def test_to_dict(self, sample_transaction: Transaction) -> None:
         """Test to_dict method."""
-        customer = TransactionCustomer(email="test@example.com", name="Test User")
-        payment = TransactionPayment(
-            id="pay_123",
-            network="polygon",
-            token="USDC",
-            address="0x1234",
-            amount=100.0,
-            status="confirmed",
-            tx_hash=["0xhash"],
-            transaction_type="payment",
-            payer_email="payer@example.com",
-            created_at="2024-01-01T00:05:00Z",
-        )
-
-        transaction = Transaction(
-            id="txn_123",
-            invoice_id="INV-001",
-            reference="ORDER-001",
-            original_amount=100.0,
-            original_currency="USD",
-            amount=100.0,
-            currency="USDC",
-            exchange_rate=1.0,
-            title="Test",
-            description="Desc",
-            status="completed",
-            paid=True,
-            customer=customer,
-            created_at="2024-01-01T00:00:00Z",
-            payment=payment,
-        )
-
-        result = transaction.to_dict()
+        result = sample_transaction.to_dict()
 
         assert result["id"] == "txn_123"
         assert result["invoice_id"] == "INV-001"
@@ -258,7 +277,7 @@ class TestTransaction:
         assert "customer" in result
         assert "payment" in result
 
-    def test_from_dict(self) -> None:
+    def test_from_dict(self, sample_transaction: Transaction) -> None:
         """Test from_dict method."""
         data: Dict[str, Any] = {
             "id": "txn_123",
@@ -295,6 +314,7 @@ class TestTransaction:
         assert transaction.invoice_id == "INV-001"
         assert isinstance(transaction.customer, TransactionCustomer)
         assert isinstance(transaction.payment, TransactionPayment)
+        assert transaction == sample_transaction
 
 
 class TestPagination:
@@ -359,47 +379,15 @@ class TestListTransactionsData:
         assert len(data.transactions) == 0
         assert data.pagination == pagination
 
-    def test_initialization_with_transactions(self) -> None:
+    def test_initialization_with_transactions(
+        self, sample_transaction: Transaction, sample_pagination: Pagination
+    ) -> None:
         """Test initialization with transactions."""
-        customer = TransactionCustomer(email="test@example.com", name="Test User")
-        payment = TransactionPayment(
-            id="pay_123",
-            network="polygon",
-            token="USDC",
-            address="0x1234",
-            amount=100.0,
-            status="confirmed",
-            tx_hash=["0xhash"],
-            transaction_type="payment",
-            payer_email="payer@example.com",
-            created_at="2024-01-01T00:05:00Z",
-        )
-
-        transaction = Transaction(
-            id="txn_123",
-            invoice_id="INV-001",
-            reference="ORDER-001",
-            original_amount=100.0,
-            original_currency="USD",
-            amount=100.0,
-            currency="USDC",
-            exchange_rate=1.0,
-            title="Test",
-            description="Desc",
-            status="completed",
-            paid=True,
-            customer=customer,
-            created_at="2024-01-01T00:00:00Z",
-            payment=payment,
-        )
-
-        pagination = Pagination(page=1, limit=10, total=1, total_pages=1, has_more=False)
-
-        data = ListTransactionsData(transactions=[transaction], pagination=pagination)
+        data = ListTransactionsData(transactions=[sample_transaction], pagination=sample_pagination)
 
         assert len(data.transactions) == 1
-        assert data.transactions[0] == transaction
-        assert data.pagination == pagination
+        assert data.transactions[0] == sample_transaction
+        assert data.pagination == sample_pagination
 
     def test_from_dict(self) -> None:
         """Test from_dict method."""
@@ -443,6 +431,37 @@ class TestListTransactionsData:
         assert data.transactions[0].id == "txn_123"
         assert data.pagination.page == 1
 
+    def test_to_columns_preserves_values(
+        self, mock_list_transactions_response_data: Dict[str, Any]
+    ) -> None:
+        """Test that to_columns keeps every value in page order."""
+        first = mock_list_transactions_response_data["data"]["transactions"][0]
+        second = {**first, "id": "txn_456", "amount": 42.5, "exchange_rate": 0.5}
+        data = ListTransactionsData.from_dict(
+            {
+                "transactions": [first, second],
+                "pagination": mock_list_transactions_response_data["data"]["pagination"],
+            }
+        )
+
+        columns = data.to_columns()
+
+        assert columns["id"] == [t.id for t in data.transactions]
+        assert columns["currency"] == [t.currency for t in data.transactions]
+        assert columns["original_currency"] == [t.original_currency for t in data.transactions]
+        assert isinstance(columns["amount"], array)
+        assert columns["amount"].typecode == "d"
+        assert list(columns["amount"]) == [t.amount for t in data.transactions]
+        assert list(columns["original_amount"]) == [t.original_amount for t in data.transactions]
+        assert list(columns["exchange_rate"]) == [1.0, 0.5]
+
+    def test_to_columns_empty_page(self) -> None:
+        """Test that an empty page gives empty columns."""
+        pagination = Pagination(page=1, limit=10, total=0, total_pages=0, has_more=False)
+        data = ListTransactionsData(transactions=[], pagination=pagination)
+
+        assert all(len(column) == 0 for column in data.to_columns().values())
+
 
 class TestListTransactionsResponse:
     """Test cases for ListTransactionsResponse model."""
@@ -456,43 +475,13 @@ class TestListTransactionsResponse:
         assert response.success is True
         assert response.data == list_data
 
-    def test_response_with_transactions(self) -> None:
+    def test_response_with_transactions(
+        self, sample_transaction: Transaction, sample_pagination: Pagination
+    ) -> None:
         """Test response with actual transactions."""
-        customer = TransactionCustomer(email="test@example.com", name="Test User")
-        payment = TransactionPayment(
-            id="pay_123",
-            network="polygon",
-            token="USDC",
-            address="0x1234",
-            amount=100.0,
-            status="confirmed",
-            tx_hash=["0xhash"],
-            transaction_type="payment",
-            payer_email="payer@example.com",
-            created_at="2024-01-01T00:05:00Z",
-        )
-
-        transaction = Transaction(
-            id="txn_123",
-            invoice_id="INV-001",
-            reference="ORDER-001",
-            original_amount=100.0,
-            original_currency="USD",
-            amount=100.0,
-            currency="USDC",
-            exchange_rate=1.0,
-            title="Test",
-            description="Desc",
-            status="completed",
-            paid=True,
-            customer=customer,
-            created_at="2024-01-01T00:00:00Z",
-            payment=payment,
+        list_data = ListTransactionsData(
+            transactions=[sample_transaction], pagination=sample_pagination
         )
-
-        pagination = Pagination(page=1, limit=10, total=1, total_pages=1, has_more=False)
-
-        list_data = ListTransactionsData(transactions=[transaction], pagination=pagination)
         response = ListTransactionsResponse(success=True, data=list_data)
 
         assert response.success is True
@@ -532,3 +521,31 @@ class TestListTransactionsResponse:
         assert "data" in result
         assert "transactions" in result["data"]
         assert "pagination" in result["data"]
+
+    def test_from_dict_unchecked_matches_from_dict(
+        self, mock_list_transactions_response_data: Dict[str, Any]
+    ) -> None:
+        """Test that the unchecked constructor builds the same models as from_dict."""
+        checked = ListTransactionsResponse.from_dict(mock_list_transactions_response_data)
+        unchecked = ListTransactionsResponse.from_dict_unchecked(
+            mock_list_transactions_response_data
+        )
+
+        assert unchecked == checked
+        transaction = unchecked.data.transactions[0]
+        assert isinstance(transaction, Transaction)
+        assert isinstance(transaction.customer, TransactionCustomer)
+        assert isinstance(transaction.payment, TransactionPayment)
+        assert isinstance(unchecked.data.pagination, Pagination)
+
+    def test_from_dict_unchecked_skips_validation(
+        self, mock_list_transactions_response_data: Dict[str, Any]
+    ) -> None:
+        """Test that the unchecked constructor does not validate or coerce values."""
+        mock_list_transactions_response_data["data"]["pagination"]["page"] = "1"
+
+        response = ListTransactionsResponse.from_dict_unchecked(
+            mock_list_transactions_response_data
+        )
+
+        assert response.data.pagination.page == "1"
@@ -1,5 +1,9 @@
 """Tests for package exports and version."""
 
+import subprocess
+import sys
+from typing import FrozenSet
+
 import pytest
 
 import nodela
@@ -241,15 +245,10 @@ class TestTypeHints:
         # The py.typed file should exist when installed
         pass
 
-    def test_exported_classes_have_type_hints(self) -> None:
+    def test_exported_classes_have_type_hints(self, client_init_params: FrozenSet[str]) -> None:
         """Test that exported classes have proper type hints."""
-        import inspect
-
-        from nodela import NodelaClient
-
-        # Check NodelaClient.__init__ has annotations
-        init_sig = inspect.signature(NodelaClient.__init__)
-        assert len(init_sig.parameters) > 0
+        # Check NodelaClient.__init__ has parameters
+        assert len(client_init_params) > 0
 
         # Check CreateInvoiceParams has annotations
         assert hasattr(CreateInvoiceParams, "__annotations__")
@@ -309,6 +308,33 @@ class TestImportPerformance:
         except Exception as e:
             pytest.fail(f"Import all failed with exception: {e}")
 
+    def test_import_defers_submodules(self) -> None:
+        """Test that a bare import loads no submodule until an export is used."""
+        code = (
+            "import sys, nodela; "
+            "assert not [m for m in sys.modules if m.startswith('nodela.')], sys.modules; "
+            "nodela.NodelaClient; "
+            "assert 'nodela.resources' in sys.modules"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_unknown_attribute_raises_attribute_error(self) -> None:
+        """Test that the lazy loader rejects names that are not exports."""
+        with pytest.raises(AttributeError, match="no attribute 'DoesNotExist'"):
+            nodela.DoesNotExist
+
+    def test_dir_lists_all_exports(self) -> None:
+        """Test that dir() includes every export, loaded or not."""
+        assert set(nodela.__all__) <= set(dir(nodela))
+
+    def test_dir_hides_helper_imports(self) -> None:
+        """Test that dir() does not list the package's own helper imports."""
+        names = set(dir(nodela))
+
+        assert names.isdisjoint({"Any", "Dict", "List", "TYPE_CHECKING", "import_module"})
+
 
 class TestNamespaceIsolation:
     """Test cases for namespace isolation."""
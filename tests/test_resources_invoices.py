@@ -1,9 +1,11 @@
 """Unit tests for Invoices resource."""
 
-from typing import Any, Dict
+import json
+from typing import Any, Callable, Dict
 from unittest.mock import patch
 
 import pytest
+from requests import Response
 
 from nodela.models.invoice import (
     CreateInvoiceParams,
@@ -36,13 +38,18 @@ class TestInvoicesCreate:
     """Test cases for creating invoices."""
 
     def test_create_minimal_invoice(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test creating invoice with minimal parameters."""
         invoices = Invoices(http_client)
         params = CreateInvoiceParams(amount=100.0, currency="USD")
 
-        with patch.object(http_client, "post", return_value=mock_invoice_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ):
             response = invoices.create(params)
 
         assert isinstance(response, CreateInvoiceResponse)
@@ -51,7 +58,10 @@ class TestInvoicesCreate:
         assert response.data.id == "inv_test123"
 
     def test_create_full_invoice(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test creating invoice with all parameters."""
         invoices = Invoices(http_client)
@@ -68,27 +78,32 @@ class TestInvoicesCreate:
             description="Test invoice description",
         )
 
-        with patch.object(http_client, "post", return_value=mock_invoice_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ):
             response = invoices.create(params)
 
         assert response.success is True
         assert response.data is not None
 
     def test_create_accepts_uppercase_currency(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test that uppercase currency is accepted."""
         invoices = Invoices(http_client)
         params = CreateInvoiceParams(amount=100.0, currency="USD")
 
         with patch.object(
-            http_client, "post", return_value=mock_invoice_response_data
-        ) as mock_post:
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ) as mock_send:
             invoices.create(params)
 
         # Check that post was called with uppercase currency
-        call_args = mock_post.call_args
-        payload = call_args[1]["data"]
+        call_args = mock_send.call_args
+        payload = json.loads(call_args[1]["content"])
         assert payload["currency"] == "USD"
 
     def test_create_lowercase_currency_raises_validation_error(
@@ -115,24 +130,41 @@ class TestInvoicesCreate:
         errors = exc_info.value.errors()
         assert any("currency" in str(error["loc"]) for error in errors)
 
+    def test_create_unvalidated_currency_raises_value_error(self, http_client: HTTPClient) -> None:
+        """Test that create rejects a currency that bypassed model validation."""
+        invoices = Invoices(http_client)
+        params = CreateInvoiceParams.model_construct(amount=100.0, currency="XYZ")
+
+        with patch.object(http_client, "_send") as mock_send:
+            with pytest.raises(ValueError, match='Unsupported currency: "XYZ"'):
+                invoices.create(params)
+
+        mock_send.assert_not_called()
+
     def test_create_calls_correct_endpoint(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test that create calls the correct API endpoint."""
         invoices = Invoices(http_client)
         params = CreateInvoiceParams(amount=100.0, currency="USD")
 
         with patch.object(
-            http_client, "post", return_value=mock_invoice_response_data
-        ) as mock_post:
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ) as mock_send:
             invoices.create(params)
 
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert call_args[0][0] == "v1/invoices"
+        mock_send.assert_called_once()
+        call_args = mock_send.call_args
+        assert call_args[0][1] == "v1/invoices"
 
     def test_create_includes_all_params_in_payload(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test that all parameters are included in the payload."""
         invoices = Invoices(http_client)
@@ -147,12 +179,12 @@ class TestInvoicesCreate:
         )
 
         with patch.object(
-            http_client, "post", return_value=mock_invoice_response_data
-        ) as mock_post:
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ) as mock_send:
             invoices.create(params)
 
-        call_args = mock_post.call_args
-        payload = call_args[1]["data"]
+        call_args = mock_send.call_args
+        payload = json.loads(call_args[1]["content"])
         assert payload["amount"] == 100.0
         assert payload["currency"] == "USD"
         assert payload["success_url"] == "https://example.com/success"
@@ -160,14 +192,39 @@ class TestInvoicesCreate:
         assert payload["title"] == "Invoice"
         assert "customer" in payload
 
+    def test_create_sends_extra_fields(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that extra fields set on the params reach the payload."""
+        invoices = Invoices(http_client)
+        params = CreateInvoiceParams.from_dict(
+            {"amount": 1, "currency": "USD", "metadata": {"a": 1}}
+        )
+
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ) as mock_send:
+            invoices.create(params)
+
+        payload = json.loads(mock_send.call_args[1]["content"])
+        assert payload == {"amount": 1.0, "currency": "USD", "metadata": {"a": 1}}
+
     def test_create_returns_error_response(
-        self, http_client: HTTPClient, mock_error_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_error_response_data: Dict[str, Any],
     ) -> None:
         """Test handling error response from create."""
         invoices = Invoices(http_client)
         params = CreateInvoiceParams(amount=100.0, currency="USD")
 
-        with patch.object(http_client, "post", return_value=mock_error_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_error_response_data)
+        ):
             response = invoices.create(params)
 
         assert response.success is False
@@ -176,7 +233,10 @@ class TestInvoicesCreate:
         assert response.data is None
 
     def test_create_with_different_currencies(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test creating invoices with various supported currencies."""
         invoices = Invoices(http_client)
@@ -185,7 +245,9 @@ class TestInvoicesCreate:
         for currency in currencies:
             params = CreateInvoiceParams(amount=100.0, currency=currency)
 
-            with patch.object(http_client, "post", return_value=mock_invoice_response_data):
+            with patch.object(
+                http_client, "_send", return_value=json_response(mock_invoice_response_data)
+            ):
                 response = invoices.create(params)
 
             assert response.success is True
@@ -195,13 +257,18 @@ class TestInvoicesVerify:
     """Test cases for verifying invoices."""
 
     def test_verify_invoice(
-        self, http_client: HTTPClient, mock_verify_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_verify_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test verifying an invoice."""
         invoices = Invoices(http_client)
         invoice_id = "inv_test123"
 
-        with patch.object(http_client, "get", return_value=mock_verify_invoice_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_verify_invoice_response_data)
+        ):
             response = invoices.verify(invoice_id)
 
         assert isinstance(response, VerifyInvoiceResponse)
@@ -210,30 +277,38 @@ class TestInvoicesVerify:
         assert response.data.id == "inv_test123"
 
     def test_verify_calls_correct_endpoint(
-        self, http_client: HTTPClient, mock_verify_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_verify_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test that verify calls the correct API endpoint."""
         invoices = Invoices(http_client)
         invoice_id = "inv_test123"
 
         with patch.object(
-            http_client, "get", return_value=mock_verify_invoice_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_verify_invoice_response_data)
+        ) as mock_send:
             invoices.verify(invoice_id)
 
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
+        mock_send.assert_called_once()
+        call_args = mock_send.call_args
         # Should call v1/invoices/{invoice_id}/verify
-        assert call_args[0][0] == "v1/invoices/inv_test123/verify"
+        assert call_args[0][1] == "v1/invoices/inv_test123/verify"
 
     def test_verify_paid_invoice(
-        self, http_client: HTTPClient, mock_verify_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_verify_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test verifying a paid invoice."""
         invoices = Invoices(http_client)
         invoice_id = "inv_test123"
 
-        with patch.object(http_client, "get", return_value=mock_verify_invoice_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_verify_invoice_response_data)
+        ):
             response = invoices.verify(invoice_id)
 
         assert response.data is not None
@@ -241,7 +316,9 @@ class TestInvoicesVerify:
         assert response.data.status == "completed"
         assert response.data.payment is not None
 
-    def test_verify_unpaid_invoice(self, http_client: HTTPClient) -> None:
+    def test_verify_unpaid_invoice(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
         """Test verifying an unpaid invoice."""
         unpaid_response: Dict[str, Any] = {
             "success": True,
@@ -261,7 +338,7 @@ class TestInvoicesVerify:
         invoices = Invoices(http_client)
         invoice_id = "inv_test123"
 
-        with patch.object(http_client, "get", return_value=unpaid_response):
+        with patch.object(http_client, "_send", return_value=json_response(unpaid_response)):
             response = invoices.verify(invoice_id)
 
         assert response.data is not None
@@ -269,13 +346,18 @@ class TestInvoicesVerify:
         assert response.data.payment is None
 
     def test_verify_error_response(
-        self, http_client: HTTPClient, mock_error_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_error_response_data: Dict[str, Any],
     ) -> None:
         """Test handling error response from verify."""
         invoices = Invoices(http_client)
         invoice_id = "inv_nonexistent"
 
-        with patch.object(http_client, "get", return_value=mock_error_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_error_response_data)
+        ):
             response = invoices.verify(invoice_id)
 
         assert response.success is False
@@ -283,53 +365,31 @@ class TestInvoicesVerify:
         assert response.data is None
 
     def test_verify_with_different_invoice_ids(
-        self, http_client: HTTPClient, mock_verify_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_verify_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test verifying invoices with different ID formats."""
         invoices = Invoices(http_client)
         invoice_ids = ["inv_test123", "inv_abc456", "invoice_12345", "INV-2024-001"]
 
         for invoice_id in invoice_ids:
-            with patch.object(http_client, "get", return_value=mock_verify_invoice_response_data):
+            with patch.object(
+                http_client, "_send", return_value=json_response(mock_verify_invoice_response_data)
+            ):
                 response = invoices.verify(invoice_id)
 
             assert response.success is True
 
 
-class TestInvoicesBuildEndpoint:
-    """Test cases for endpoint building."""
-
-    def test_build_endpoint(self, http_client: HTTPClient) -> None:
-        """Test _build_endpoint method."""
-        invoices = Invoices(http_client)
-
-        endpoint = invoices._build_endpoint("v1/invoices", "inv_123", "verify")
-
-        assert endpoint == "v1/invoices/inv_123/verify"
-
-    def test_build_endpoint_single_part(self, http_client: HTTPClient) -> None:
-        """Test building endpoint with single part."""
-        invoices = Invoices(http_client)
-
-        endpoint = invoices._build_endpoint("v1/invoices")
-
-        assert endpoint == "v1/invoices"
-
-    def test_build_endpoint_with_integers(self, http_client: HTTPClient) -> None:
-        """Test building endpoint with integer parts."""
-        invoices = Invoices(http_client)
-
-        endpoint = invoices._build_endpoint("v1/invoices", 123, "verify")
-
-        assert endpoint == "v1/invoices/123/verify"
-
-
 class TestInvoicesIntegration:
     """Integration-style tests for Invoices resource."""
 
     def test_create_and_verify_flow(
         self,
         http_client: HTTPClient,
+        json_response: Callable[..., Response],
         mock_invoice_response_data: Dict[str, Any],
         mock_verify_invoice_response_data: Dict[str, Any],
     ) -> None:
@@ -339,7 +399,9 @@ class TestInvoicesIntegration:
         # Create invoice
         params = CreateInvoiceParams(amount=100.0, currency="USD", reference="ORDER-001")
 
-        with patch.object(http_client, "post", return_value=mock_invoice_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ):
             create_response = invoices.create(params)
 
         assert create_response.success is True
@@ -347,7 +409,9 @@ class TestInvoicesIntegration:
         invoice_id = create_response.data.id
 
         # Verify invoice
-        with patch.object(http_client, "get", return_value=mock_verify_invoice_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_verify_invoice_response_data)
+        ):
             verify_response = invoices.verify(invoice_id)
 
         assert verify_response.success is True
@@ -355,7 +419,10 @@ class TestInvoicesIntegration:
         assert verify_response.data.id == invoice_id
 
     def test_create_with_customer_info(
-        self, http_client: HTTPClient, mock_invoice_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_invoice_response_data: Dict[str, Any],
     ) -> None:
         """Test creating invoice with customer information."""
         invoices = Invoices(http_client)
@@ -369,15 +436,15 @@ class TestInvoicesIntegration:
         )
 
         with patch.object(
-            http_client, "post", return_value=mock_invoice_response_data
-        ) as mock_post:
+            http_client, "_send", return_value=json_response(mock_invoice_response_data)
+        ) as mock_send:
             response = invoices.create(params)
 
         assert response.success is True
 
         # Verify customer info was sent
-        call_args = mock_post.call_args
-        payload = call_args[1]["data"]
+        call_args = mock_send.call_args
+        payload = json.loads(call_args[1]["content"])
         assert "customer" in payload
         assert payload["customer"]["email"] == "customer@example.com"
         assert payload["customer"]["name"] == "John Doe"
@@ -1,9 +1,13 @@
 """Unit tests for Transactions resource."""
 
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from unittest.mock import patch
 
-from nodela.models.transaction import ListTransactionsResponse
+import pytest
+from requests import Response
+
+from nodela.exceptions import AuthenticationError
+from nodela.models.transaction import ListTransactionsResponse, Transaction
 from nodela.resources.transactions import Transactions
 from nodela.utils.http import HTTPClient
 
@@ -29,12 +33,17 @@ class TestTransactionsList:
     """Test cases for listing transactions."""
 
     def test_list_without_params(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test listing transactions without parameters."""
         transactions = Transactions(http_client)
 
-        with patch.object(http_client, "get", return_value=mock_list_transactions_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ):
             response = transactions.list()
 
         assert isinstance(response, ListTransactionsResponse)
@@ -42,91 +51,111 @@ class TestTransactionsList:
         assert response.data is not None
 
     def test_list_calls_correct_endpoint(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test that list calls the correct API endpoint."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list()
 
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
-        assert call_args[0][0] == "v1/transactions"
+        mock_send.assert_called_once()
+        call_args = mock_send.call_args
+        assert call_args[0][1] == "v1/transactions"
 
     def test_list_with_page_param(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test listing transactions with page parameter."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list(page=2)
 
-        call_args = mock_get.call_args
+        call_args = mock_send.call_args
         params = call_args[1]["params"]
         assert params is not None
         assert params["page"] == 2
 
     def test_list_with_limit_param(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test listing transactions with limit parameter."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list(limit=25)
 
-        call_args = mock_get.call_args
+        call_args = mock_send.call_args
         params = call_args[1]["params"]
         assert params is not None
         assert params["limit"] == 25
 
     def test_list_with_both_params(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test listing transactions with both page and limit."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list(page=3, limit=50)
 
-        call_args = mock_get.call_args
+        call_args = mock_send.call_args
         params = call_args[1]["params"]
         assert params is not None
         assert params["page"] == 3
         assert params["limit"] == 50
 
     def test_list_without_params_passes_none(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test that list without params passes None for params."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list()
 
-        call_args = mock_get.call_args
+        call_args = mock_send.call_args
         params = call_args[1]["params"]
         assert params is None
 
     def test_list_response_has_transactions(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test that list response contains transactions."""
         transactions = Transactions(http_client)
 
-        with patch.object(http_client, "get", return_value=mock_list_transactions_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ):
             response = transactions.list()
 
         assert response.data.transactions is not None
@@ -134,12 +163,17 @@ class TestTransactionsList:
         assert response.data.transactions[0].id == "txn_test123"
 
     def test_list_response_has_pagination(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test that list response contains pagination info."""
         transactions = Transactions(http_client)
 
-        with patch.object(http_client, "get", return_value=mock_list_transactions_response_data):
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ):
             response = transactions.list()
 
         assert response.data.pagination is not None
@@ -149,7 +183,9 @@ class TestTransactionsList:
         assert response.data.pagination.total_pages == 1
         assert response.data.pagination.has_more is False
 
-    def test_list_empty_transactions(self, http_client: HTTPClient) -> None:
+    def test_list_empty_transactions(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
         """Test listing when there are no transactions."""
         empty_response: Dict[str, Any] = {
             "success": True,
@@ -167,14 +203,16 @@ class TestTransactionsList:
 
         transactions = Transactions(http_client)
 
-        with patch.object(http_client, "get", return_value=empty_response):
+        with patch.object(http_client, "_send", return_value=json_response(empty_response)):
             response = transactions.list()
 
         assert response.success is True
         assert len(response.data.transactions) == 0
         assert response.data.pagination.total == 0
 
-    def test_list_multiple_transactions(self, http_client: HTTPClient) -> None:
+    def test_list_multiple_transactions(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
         """Test listing with multiple transactions."""
         multi_response: Dict[str, Any] = {
             "success": True,
@@ -222,13 +260,15 @@ class TestTransactionsList:
 
         transactions = Transactions(http_client)
 
-        with patch.object(http_client, "get", return_value=multi_response):
+        with patch.object(http_client, "_send", return_value=json_response(multi_response)):
             response = transactions.list()
 
         assert len(response.data.transactions) == 5
         assert response.data.pagination.total == 5
 
-    def test_list_with_pagination_has_more(self, http_client: HTTPClient) -> None:
+    def test_list_with_pagination_has_more(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
         """Test listing with pagination indicating more pages."""
         paginated_response: Dict[str, Any] = {
             "success": True,
@@ -275,67 +315,108 @@ class TestTransactionsList:
 
         transactions = Transactions(http_client)
 
-        with patch.object(http_client, "get", return_value=paginated_response):
+        with patch.object(http_client, "_send", return_value=json_response(paginated_response)):
             response = transactions.list(page=1, limit=1)
 
         assert response.data.pagination.has_more is True
         assert response.data.pagination.total_pages == 100
 
     def test_list_with_page_zero(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test listing with page 0 (edge case)."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list(page=0)
 
-        call_args = mock_get.call_args
+        call_args = mock_send.call_args
         params = call_args[1]["params"]
         assert params["page"] == 0
 
     def test_list_with_large_limit(
-        self, http_client: HTTPClient, mock_list_transactions_response_data: Dict[str, Any]
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
     ) -> None:
         """Test listing with a large limit value."""
         transactions = Transactions(http_client)
 
         with patch.object(
-            http_client, "get", return_value=mock_list_transactions_response_data
-        ) as mock_get:
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
             transactions.list(limit=1000)
 
-        call_args = mock_get.call_args
+        call_args = mock_send.call_args
         params = call_args[1]["params"]
         assert params["limit"] == 1000
 
 
-class TestTransactionsBuildEndpoint:
-    """Test cases for endpoint building."""
+class TestTransactionsIter:
+    """Test cases for lazily iterating transactions."""
 
-    def test_build_endpoint(self, http_client: HTTPClient) -> None:
-        """Test _build_endpoint method."""
+    def test_iter_yields_transactions(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that iter yields validated Transaction models."""
         transactions = Transactions(http_client)
 
-        endpoint = transactions._build_endpoint("v1/transactions", "filter")
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ) as mock_send:
+            result = list(transactions.iter(page=2, limit=5))
+
+        assert len(result) == 1
+        assert isinstance(result[0], Transaction)
+        assert result[0].id == "txn_test123"
+        assert mock_send.call_args[0][1] == "v1/transactions"
+        assert mock_send.call_args[1]["params"] == {"page": 2, "limit": 5}
+
+    def test_iter_validates_on_demand(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., Response],
+        mock_list_transactions_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that items past the point the caller stops are not validated."""
+        transactions = Transactions(http_client)
+        items = mock_list_transactions_response_data["data"]["transactions"]
+        items.append({"id": "txn_invalid"})
 
-        assert endpoint == "v1/transactions/filter"
+        with patch.object(
+            http_client, "_send", return_value=json_response(mock_list_transactions_response_data)
+        ):
+            first = next(transactions.iter())
 
-    def test_build_endpoint_single_part(self, http_client: HTTPClient) -> None:
-        """Test building endpoint with single part."""
-        transactions = Transactions(http_client)
+        assert first.id == "txn_test123"
 
-        endpoint = transactions._build_endpoint("v1/transactions")
+    def test_iter_fetches_page_on_call(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
+        """Test that request errors are raised by iter itself, before iterating."""
+        transactions = Transactions(http_client)
+        response = json_response({"message": "Unauthorized"}, status_code=401)
 
-        assert endpoint == "v1/transactions"
+        with patch.object(http_client, "_send", return_value=response):
+            with pytest.raises(AuthenticationError):
+                transactions.iter()
 
 
 class TestTransactionsIntegration:
     """Integration-style tests for Transactions resource."""
 
-    def test_paginated_listing_flow(self, http_client: HTTPClient) -> None:
+    def test_paginated_listing_flow(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
         """Test pagination flow through multiple pages."""
         transactions = Transactions(http_client)
 
@@ -384,7 +465,7 @@ class TestTransactionsIntegration:
             },
         }
 
-        with patch.object(http_client, "get", return_value=page1_response):
+        with patch.object(http_client, "_send", return_value=json_response(page1_response)):
             response1 = transactions.list(page=1, limit=10)
 
         assert len(response1.data.transactions) == 10
@@ -435,13 +516,15 @@ class TestTransactionsIntegration:
             },
         }
 
-        with patch.object(http_client, "get", return_value=page2_response):
+        with patch.object(http_client, "_send", return_value=json_response(page2_response)):
             response2 = transactions.list(page=2, limit=10)
 
         assert response2.data.pagination.page == 2
         assert response2.data.pagination.has_more is True
 
-    def test_different_limit_sizes(self, http_client: HTTPClient) -> None:
+    def test_different_limit_sizes(
+        self, http_client: HTTPClient, json_response: Callable[..., Response]
+    ) -> None:
         """Test listing with different limit sizes."""
         transactions = Transactions(http_client)
         limits = [5, 10, 20, 50, 100]
@@ -461,7 +544,7 @@ class TestTransactionsIntegration:
                 },
             }
 
-            with patch.object(http_client, "get", return_value=response_data):
+            with patch.object(http_client, "_send", return_value=json_response(response_data)):
                 response = transactions.list(limit=limit)
 
             assert response.data.pagination.limit == limit
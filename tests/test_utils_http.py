@@ -1,6 +1,7 @@
 """Unit tests for HTTP client utilities."""
 
-from typing import Any, Dict
+import json
+from typing import Any, Callable, Dict, Optional
 from unittest.mock import Mock, patch
 
 import pytest
@@ -16,6 +17,8 @@ from nodela.exceptions import (
     ServerError,
     ValidationError,
 )
+from nodela.models.invoice import CreateInvoiceResponse
+from nodela.models.transaction import ListTransactionsResponse
 from nodela.utils.http import HTTPClient
 
 
@@ -37,6 +40,7 @@ class TestHTTPClientInitialization:
 
         assert client.base_url == "https://api.nodela.co"
         assert not client.base_url.endswith("/")
+        assert client._url_prefix == "https://api.nodela.co/"
 
     def test_initialization_with_custom_timeout(self, api_key: str, base_url: str) -> None:
         """Test initialization with custom timeout."""
@@ -53,44 +57,83 @@ class TestHTTPClientInitialization:
 
     def test_session_has_retry_adapter(self, http_client: HTTPClient) -> None:
         """Test that session has retry adapter mounted."""
-        assert "https://" in http_client.session.adapters
-        assert "http://" in http_client.session.adapters
+        adapter = http_client.session.get_adapter("https://api.nodela.co")
+
+        assert adapter is http_client.session.get_adapter("http://api.nodela.co")
+        assert adapter.max_retries.total == 3
+
+    def test_connection_pool_configuration(self, api_key: str, base_url: str) -> None:
+        """Test that the adapter pool is sized from pool_maxsize."""
+        default_client = HTTPClient(base_url=base_url, api_key=api_key)
+        client = HTTPClient(base_url=base_url, api_key=api_key, pool_maxsize=32)
+
+        default_adapter = default_client.session.get_adapter("https://api.nodela.co")
+        adapter = client.session.get_adapter("https://api.nodela.co")
+
+        assert default_adapter._pool_maxsize == 10
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_connections == 1
+
+    def test_retry_strategy_configuration(self, api_key: str, base_url: str) -> None:
+        """Test that the mounted adapter uses the configured retry strategy."""
+        client = HTTPClient(base_url=base_url, api_key=api_key, max_retries=5)
+        retry = client.session.get_adapter("https://api.nodela.co").max_retries
+
+        assert retry.total == 5
+        assert retry.backoff_factor == 1
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+
+    def test_retry_strategy_shared_between_clients(self, api_key: str, base_url: str) -> None:
+        """Test that clients with the same retry budget share one Retry object."""
+        client1 = HTTPClient(base_url=base_url, api_key=api_key, max_retries=4)
+        client2 = HTTPClient(base_url=base_url, api_key=api_key, max_retries=4)
+        client3 = HTTPClient(base_url=base_url, api_key=api_key, max_retries=2)
+
+        retry1 = client1.session.get_adapter("https://api.nodela.co").max_retries
+        retry2 = client2.session.get_adapter("https://api.nodela.co").max_retries
+        retry3 = client3.session.get_adapter("https://api.nodela.co").max_retries
+
+        assert retry1 is retry2
+        assert retry1 is not retry3
+        assert client1.session.adapters["https://"] is not client2.session.adapters["https://"]
 
 
 class TestHTTPClientHeaders:
-    """Test cases for HTTPClient header building."""
+    """Test cases for HTTPClient default headers."""
 
-    def test_get_headers_basic(self, http_client: HTTPClient) -> None:
-        """Test basic header generation."""
-        headers = http_client._get_headers()
+    def _prepared_headers(
+        self, http_client: HTTPClient, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, str]:
+        """Return the headers the session would send for a request."""
+        request = requests.Request("GET", "https://api.nodela.co/test", headers=headers)
+        return dict(http_client.session.prepare_request(request).headers)
+
+    def test_session_default_headers(self, http_client: HTTPClient) -> None:
+        """Test that default headers are set on the session."""
+        headers = http_client.session.headers
 
-        assert "Authorization" in headers
         assert headers["Authorization"] == f"Bearer {http_client.api_key}"
         assert headers["Content-Type"] == "application/json"
         assert headers["User-Agent"] == "NodelaSDK/1.0"
 
-    def test_get_headers_with_custom_headers(self, http_client: HTTPClient) -> None:
-        """Test header generation with custom headers."""
-        custom = {"X-Custom-Header": "custom-value"}
-        headers = http_client._get_headers(custom)
+    def test_headers_with_custom_headers(self, http_client: HTTPClient) -> None:
+        """Test that custom headers are merged with the defaults."""
+        headers = self._prepared_headers(http_client, {"X-Custom-Header": "custom-value"})
 
         assert headers["Authorization"] == f"Bearer {http_client.api_key}"
         assert headers["Content-Type"] == "application/json"
         assert headers["X-Custom-Header"] == "custom-value"
 
-    def test_get_headers_custom_overrides_default(self, http_client: HTTPClient) -> None:
+    def test_headers_custom_overrides_default(self, http_client: HTTPClient) -> None:
         """Test that custom headers can override defaults."""
-        custom = {"Content-Type": "application/xml"}
-        headers = http_client._get_headers(custom)
+        headers = self._prepared_headers(http_client, {"Content-Type": "application/xml"})
 
         assert headers["Content-Type"] == "application/xml"
 
-    def test_get_headers_preserves_auth(self, http_client: HTTPClient) -> None:
-        """Test that authorization header is always present."""
-        custom = {"Authorization": "Bearer different_token"}
-        headers = http_client._get_headers(custom)
+    def test_headers_custom_overrides_auth(self, http_client: HTTPClient) -> None:
+        """Test that a custom authorization header overrides the default."""
+        headers = self._prepared_headers(http_client, {"Authorization": "Bearer different_token"})
 
-        # Custom auth should override
         assert headers["Authorization"] == "Bearer different_token"
 
 
@@ -101,7 +144,7 @@ class TestHTTPClientResponseHandling:
         """Test handling successful 200 response."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = json.dumps({"data": "success"}).encode()
 
         result = http_client._handle_response(mock_response)
 
@@ -111,7 +154,7 @@ class TestHTTPClientResponseHandling:
         """Test handling successful 201 response."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 201
-        mock_response.json.return_value = {"data": "created"}
+        mock_response.content = json.dumps({"data": "created"}).encode()
 
         result = http_client._handle_response(mock_response)
 
@@ -121,7 +164,7 @@ class TestHTTPClientResponseHandling:
         """Test handling response with invalid JSON."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Plain text response"
         mock_response.text = "Plain text response"
 
         result = http_client._handle_response(mock_response)
@@ -132,19 +175,18 @@ class TestHTTPClientResponseHandling:
         """Test that 401 response raises AuthenticationError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 401
-        mock_response.json.return_value = {"message": "Unauthorized"}
+        mock_response.content = json.dumps({"message": "Unauthorized"}).encode()
 
-        with pytest.raises(AuthenticationError) as exc_info:
+        with pytest.raises(AuthenticationError, match="Unauthorized") as exc_info:
             http_client._handle_response(mock_response)
 
         assert exc_info.value.status_code == 401
-        assert "Unauthorized" in str(exc_info.value)
 
     def test_handle_response_400_raises_validation_error(self, http_client: HTTPClient) -> None:
         """Test that 400 response raises ValidationError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 400
-        mock_response.json.return_value = {"message": "Bad request"}
+        mock_response.content = json.dumps({"message": "Bad request"}).encode()
 
         with pytest.raises(ValidationError) as exc_info:
             http_client._handle_response(mock_response)
@@ -155,7 +197,7 @@ class TestHTTPClientResponseHandling:
         """Test that 422 response raises ValidationError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 422
-        mock_response.json.return_value = {"message": "Unprocessable entity"}
+        mock_response.content = json.dumps({"message": "Unprocessable entity"}).encode()
 
         with pytest.raises(ValidationError) as exc_info:
             http_client._handle_response(mock_response)
@@ -166,7 +208,7 @@ class TestHTTPClientResponseHandling:
         """Test that 404 response raises NotFoundError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 404
-        mock_response.json.return_value = {"message": "Not found"}
+        mock_response.content = json.dumps({"message": "Not found"}).encode()
 
         with pytest.raises(NotFoundError) as exc_info:
             http_client._handle_response(mock_response)
@@ -177,7 +219,7 @@ class TestHTTPClientResponseHandling:
         """Test that 429 response raises RateLimitError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 429
-        mock_response.json.return_value = {"message": "Too many requests"}
+        mock_response.content = json.dumps({"message": "Too many requests"}).encode()
 
         with pytest.raises(RateLimitError) as exc_info:
             http_client._handle_response(mock_response)
@@ -188,7 +230,7 @@ class TestHTTPClientResponseHandling:
         """Test that 500 response raises ServerError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 500
-        mock_response.json.return_value = {"message": "Internal server error"}
+        mock_response.content = json.dumps({"message": "Internal server error"}).encode()
 
         with pytest.raises(ServerError) as exc_info:
             http_client._handle_response(mock_response)
@@ -199,7 +241,7 @@ class TestHTTPClientResponseHandling:
         """Test that 502 response raises ServerError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 502
-        mock_response.json.return_value = {"message": "Bad gateway"}
+        mock_response.content = json.dumps({"message": "Bad gateway"}).encode()
 
         with pytest.raises(ServerError) as exc_info:
             http_client._handle_response(mock_response)
@@ -212,7 +254,7 @@ class TestHTTPClientResponseHandling:
         """Test that other status codes raise NodelaError."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 418  # I'm a teapot
-        mock_response.json.return_value = {"message": "I'm a teapot"}
+        mock_response.content = json.dumps({"message": "I'm a teapot"}).encode()
 
         with pytest.raises(NodelaError) as exc_info:
             http_client._handle_response(mock_response)
@@ -224,7 +266,7 @@ class TestHTTPClientResponseHandling:
         response_data = {"message": "Error", "details": {"field": "value"}}
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 400
-        mock_response.json.return_value = response_data
+        mock_response.content = json.dumps(response_data).encode()
 
         with pytest.raises(ValidationError) as exc_info:
             http_client._handle_response(mock_response)
@@ -240,7 +282,7 @@ class TestHTTPClientRequest:
         """Test GET request."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = json.dumps({"data": "success"}).encode()
         mock_request.return_value = mock_response
 
         result = http_client.request("GET", "/test-endpoint")
@@ -256,7 +298,7 @@ class TestHTTPClientRequest:
         """Test POST request with data."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 201
-        mock_response.json.return_value = {"data": "created"}
+        mock_response.content = json.dumps({"data": "created"}).encode()
         mock_request.return_value = mock_response
 
         data: Dict[str, Any] = {"key": "value"}
@@ -271,7 +313,7 @@ class TestHTTPClientRequest:
         """Test request with query parameters."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = json.dumps({"data": "success"}).encode()
         mock_request.return_value = mock_response
 
         params: Dict[str, Any] = {"page": 1, "limit": 10}
@@ -287,7 +329,7 @@ class TestHTTPClientRequest:
         """Test that leading slash is handled correctly."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = json.dumps({"data": "success"}).encode()
         mock_request.return_value = mock_response
 
         http_client.request("GET", "/endpoint")
@@ -302,11 +344,9 @@ class TestHTTPClientRequest:
         """Test that timeout raises NetworkError."""
         mock_request.side_effect = Timeout("Request timed out")
 
-        with pytest.raises(NetworkError) as exc_info:
+        with pytest.raises(NetworkError, match="timed out"):
             http_client.request("GET", "/slow-endpoint")
 
-        assert "timed out" in str(exc_info.value)
-
     @patch("nodela.utils.http.requests.Session.request")
     def test_request_connection_error_raises_network_error(
         self, mock_request: Mock, http_client: HTTPClient
@@ -314,11 +354,9 @@ class TestHTTPClientRequest:
         """Test that connection error raises NetworkError."""
         mock_request.side_effect = ConnectionError("Connection refused")
 
-        with pytest.raises(NetworkError) as exc_info:
+        with pytest.raises(NetworkError, match="Connection error"):
             http_client.request("GET", "/endpoint")
 
-        assert "Connection error" in str(exc_info.value)
-
     @patch("nodela.utils.http.requests.Session.request")
     def test_request_generic_exception_raises_nodela_error(
         self, mock_request: Mock, http_client: HTTPClient
@@ -326,41 +364,142 @@ class TestHTTPClientRequest:
         """Test that generic RequestException raises NodelaError."""
         mock_request.side_effect = RequestException("Generic error")
 
-        with pytest.raises(NodelaError) as exc_info:
+        with pytest.raises(NodelaError, match="Request failed"):
             http_client.request("GET", "/endpoint")
 
-        assert "Request failed" in str(exc_info.value)
-
-    @patch("nodela.utils.http.requests.Session.request")
-    def test_request_includes_headers(self, mock_request: Mock, http_client: HTTPClient) -> None:
-        """Test that request includes proper headers."""
-        mock_response = Mock(spec=requests.Response)
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "success"}
-        mock_request.return_value = mock_response
+    @patch("nodela.utils.http.HTTPAdapter.send")
+    def test_request_includes_headers(
+        self,
+        mock_send: Mock,
+        http_client: HTTPClient,
+        json_response: Callable[..., requests.Response],
+    ) -> None:
+        """Test that the sent request carries the default headers."""
+        mock_send.return_value = json_response({"data": "success"})
 
         http_client.request("GET", "/endpoint")
 
-        call_args = mock_request.call_args
-        headers = call_args[1]["headers"]
-        assert "Authorization" in headers
-        assert "Content-Type" in headers
-        assert "User-Agent" in headers
+        headers = mock_send.call_args[0][0].headers
+        assert headers["Authorization"] == f"Bearer {http_client.api_key}"
+        assert headers["Content-Type"] == "application/json"
+        assert headers["User-Agent"] == "NodelaSDK/1.0"
 
     @patch("nodela.utils.http.requests.Session.request")
     def test_request_with_custom_headers(self, mock_request: Mock, http_client: HTTPClient) -> None:
         """Test request with custom headers."""
         mock_response = Mock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "success"}
+        mock_response.content = json.dumps({"data": "success"}).encode()
         mock_request.return_value = mock_response
 
         custom_headers = {"X-Custom": "value"}
         http_client.request("GET", "/endpoint", headers=custom_headers)
 
         call_args = mock_request.call_args
-        headers = call_args[1]["headers"]
-        assert headers["X-Custom"] == "value"
+        assert call_args[1]["headers"] == custom_headers
+
+
+class TestHTTPClientRequestModel:
+    """Test cases for HTTPClient request_model method."""
+
+    def test_request_model_validates_json_body(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., requests.Response],
+        mock_list_transactions_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that a successful body is validated into the given model."""
+        response = json_response(mock_list_transactions_response_data)
+
+        with patch.object(http_client.session, "request", return_value=response):
+            result = http_client.request_model("GET", "/list", ListTransactionsResponse)
+
+        assert isinstance(result, ListTransactionsResponse)
+        assert result.data.transactions[0].id == "txn_test123"
+
+    def test_request_model_accepts_201(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., requests.Response],
+        mock_invoice_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that a 201 body is validated into the given model."""
+        response = json_response(mock_invoice_response_data, status_code=201)
+
+        with patch.object(http_client.session, "request", return_value=response):
+            result = http_client.request_model("POST", "/create", CreateInvoiceResponse)
+
+        assert result.data is not None
+        assert result.data.id == "inv_test123"
+
+    def test_request_model_sends_preserialized_content(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., requests.Response],
+        mock_invoice_response_data: Dict[str, Any],
+    ) -> None:
+        """Test that pre-serialized content is sent as the body as-is."""
+        response = json_response(mock_invoice_response_data, status_code=201)
+        body = b'{"amount":100.0,"currency":"USD"}'
+
+        with patch.object(http_client.session, "request", return_value=response) as mock_request:
+            http_client.request_model("POST", "/create", CreateInvoiceResponse, content=body)
+
+        call_kwargs = mock_request.call_args[1]
+        assert call_kwargs["data"] == body
+        assert call_kwargs["json"] is None
+
+    def test_request_model_error_raises_mapped_exception(
+        self, http_client: HTTPClient, json_response: Callable[..., requests.Response]
+    ) -> None:
+        """Test that error responses raise the mapped exception."""
+        response = json_response({"message": "Not found"}, status_code=404)
+
+        with patch.object(http_client.session, "request", return_value=response):
+            with pytest.raises(NotFoundError) as exc_info:
+                http_client.request_model("GET", "/missing", ListTransactionsResponse)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.response == {"message": "Not found"}
+
+
+class TestHTTPClientStdlibJSONFallback:
+    """Test cases for parsing bodies with json.loads when orjson is missing."""
+
+    def test_request_parses_with_json_loads(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., requests.Response],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that request parses bodies with the stdlib fallback."""
+        fallback = Mock(wraps=json.loads)
+        monkeypatch.setattr("nodela.utils.http._json_loads", fallback)
+        response = json_response({"data": "success"})
+
+        with patch.object(http_client.session, "request", return_value=response):
+            result = http_client.request("GET", "/test-endpoint")
+
+        assert result == {"data": "success"}
+        fallback.assert_called_once_with(response.content)
+
+    def test_request_model_error_body_parses_with_json_loads(
+        self,
+        http_client: HTTPClient,
+        json_response: Callable[..., requests.Response],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that request_model parses error bodies with the stdlib fallback."""
+        fallback = Mock(wraps=json.loads)
+        monkeypatch.setattr("nodela.utils.http._json_loads", fallback)
+        response = json_response({"message": "Not found"}, status_code=404)
+
+        with patch.object(http_client.session, "request", return_value=response):
+            with pytest.raises(NotFoundError) as exc_info:
+                http_client.request_model("GET", "/missing", ListTransactionsResponse)
+
+        assert exc_info.value.response == {"message": "Not found"}
+        fallback.assert_called_once_with(response.content)
 
 
 class TestHTTPClientConvenienceMethods:
@@ -437,3 +576,20 @@ class TestHTTPClientConvenienceMethods:
 
         assert result == {"data": "deleted"}
         mock_request.assert_called_once_with("DELETE", "/endpoint")
+
+
+class TestHTTPClientWarmUp:
+    """Test cases for HTTPClient warm_up method."""
+
+    def test_warm_up_sends_head_to_base_url(self, http_client: HTTPClient) -> None:
+        """Test that warm_up sends a HEAD request to the base URL."""
+        with patch.object(http_client.session, "head") as mock_head:
+            http_client.warm_up()
+
+        mock_head.assert_called_once_with(f"{http_client.base_url}/", timeout=http_client.timeout)
+        mock_head.return_value.close.assert_called_once()
+
+    def test_warm_up_ignores_request_errors(self, http_client: HTTPClient) -> None:
+        """Test that connection failures during warm-up are swallowed."""
+        with patch.object(http_client.session, "head", side_effect=ConnectionError("down")):
+            http_client.warm_up()